@@ -1,3 +1,4 @@
-from .competitive_research import competitive_research
+from .competitive_research import CompetitiveResearch
+from .ui_updates import UIUpdates
 
-__all__ = ["competitive_research"]
\ No newline at end of file
+__all__ = ["CompetitiveResearch", "UIUpdates"]
@@ -0,0 +1,60 @@
+"""
+In-process TTL cache for competitor research results.
+"""
+import threading
+import time
+
+
+class TtlCache:
+    """
+    Small thread-safe TTL cache with stale-while-revalidate support.
+
+    Entries older than ttl are treated as misses. Entries older than ttl/2
+    are still returned but reported as stale, so callers can serve them
+    immediately and refresh in the background.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl: float = 6 * 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, key) -> tuple | None:
+        """
+        Look up a live entry.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            (value, is_stale) if the entry is within ttl, None otherwise
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            age = now - stored_at
+            if age > self.ttl:
+                del self._entries[key]
+                return None
+            return value, age > self.ttl / 2
+
+    def store(self, key, value) -> None:
+        """
+        Store a value, evicting the oldest entry when the cache is full.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                oldest = min(self._entries, key=lambda k: self._entries[k][1])
+                del self._entries[oldest]
+            self._entries[key] = (value, time.monotonic())
+
+    def __contains__(self, key) -> bool:
+        return self.lookup(key) is not None
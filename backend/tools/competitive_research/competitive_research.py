@@ -1,22 +1,40 @@
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from enum import Enum
-from typing import Optional, Literal
+from typing import Annotated, Optional, Literal, get_args, get_origin
+from typing_extensions import TypedDict
 from strands import Agent, tool
 from strands.models import BedrockModel
 from strands.multiagent import Swarm
 from strands_tools import think
-from strands_tools.tavily import tavily_search, tavily_crawl, tavily_extract
+# Aliased so the caching wrappers below can register under the original tool
+# names the swarm system prompts refer to
+from strands_tools.tavily import (
+    tavily_search as _tavily_search,
+    tavily_crawl as _tavily_crawl,
+    tavily_extract as _tavily_extract,
+)
+from .cache import TtlCache
 from .prompts import (
     find_competitors_prompt, 
-    find_competitors_system_prompt,
+    find_competitors_fast_prompt,
     competitor_overview_swarm_system_prompt,
     product_researcher_swarm_system_prompt,
     distribution_researcher_swarm_system_prompt,
     publicity_researcher_swarm_system_prompt,
     competitor_analysis_swarm_prompt,
+    compile_prompt,
+    render_find_competitors_system_prompt,
 )
+import asyncio
+import json
 import logging
+import threading
+from urllib.parse import urlparse
+try:
+    import orjson
+except ImportError:
+    orjson = None
 logging.getLogger("strands.multiagent").setLevel(logging.WARNING)
 tavily_logger = logging.getLogger("strands_agents.tools.tavily")
 tavily_logger.setLevel(logging.WARNING)
@@ -39,34 +57,37 @@ class TargetChannelEnum(str, Enum):
     TRADE_SHOWS_OR_EVENTS = "Trade Shows or Events"
 
 class FindCompetitor(BaseModel):
+    model_config = ConfigDict(revalidate_instances='never', extra='ignore')
     competitor_name: str = Field(description="The name of the competitor")
     competitor_url: str = Field(description="The URL of the competitor's verified home page. With the 'https://' or 'http://'")
 
 class FindCompetitorsOutput(BaseModel):
+    model_config = ConfigDict(revalidate_instances='never', extra='ignore')
     competitors: list[FindCompetitor] = Field(description="The competitors found")
 
-class CompetitorProductCustomerSentiment(BaseModel):
-    key_themes: list[str] = Field(description="The key themes of the competitor's product based on customer sentiment. e.g. 'Common praises', 'Complaints', 'Frequently mentioned features or issues'")
-    overall_sentiment: str = Field(description="The overall sentiment of the competitor's product based on customer sentiment")
-    strengths: list[str] = Field(description="The strengths of the competitor's product based on customer sentiment")
-    weaknesses: list[str] = Field(description="The weaknesses of the competitor's product based on customer sentiment")
+class CompetitorProductCustomerSentiment(TypedDict):
+    key_themes: Annotated[list[str], Field(description="The key themes of the competitor's product based on customer sentiment. e.g. 'Common praises', 'Complaints', 'Frequently mentioned features or issues'")]
+    overall_sentiment: Annotated[str, Field(description="The overall sentiment of the competitor's product based on customer sentiment")]
+    strengths: Annotated[list[str], Field(description="The strengths of the competitor's product based on customer sentiment")]
+    weaknesses: Annotated[list[str], Field(description="The weaknesses of the competitor's product based on customer sentiment")]
 
-class TargetAudience(BaseModel):
-    target_audience_description: str = Field(description="Description of the target audience of the competitor's product")
-    target_sectors: list[str] = Field(description="The industry of the target industry or sectors of the competitor's product")
-    typical_segment_size: Literal["SMB", "Enterprise", "Startups"] = Field(description="The typical segment size of the target audience of the competitor's product")
-    key_decision_makers: list[str] = Field(description="The key decision-makers of the target audience of the competitor's product. e.g. 'Procurement teams', 'IT managers', 'etc.'")
+class TargetAudience(TypedDict):
+    target_audience_description: Annotated[str, Field(description="Description of the target audience of the competitor's product")]
+    target_sectors: Annotated[list[str], Field(description="The industry of the target industry or sectors of the competitor's product")]
+    typical_segment_size: Annotated[Literal["SMB", "Enterprise", "Startups"], Field(description="The typical segment size of the target audience of the competitor's product")]
+    key_decision_makers: Annotated[list[str], Field(description="The key decision-makers of the target audience of the competitor's product. e.g. 'Procurement teams', 'IT managers', 'etc.'")]
 
-class CompetitorPricing(BaseModel):
-    pricing: str = Field(description="The pricing of the competitor's product")
-    pricing_model: str = Field(description="Description of the pricing model of the competitor's product")
+class CompetitorPricing(TypedDict):
+    pricing: Annotated[str, Field(description="The pricing of the competitor's product")]
+    pricing_model: Annotated[str, Field(description="Description of the pricing model of the competitor's product")]
 
-class DistributionChannel(BaseModel):
-    distribution_model: Literal[*[e.value for e in DistributionModelEnum]] = Field(description="The distribution model of the competitor's product")
-    distribution_model_justification: str = Field(description="The justification for the distribution model of the competitor's product")
-    target_channels: list[Literal[*[e.value for e in TargetChannelEnum]]] = Field(description="The target channels of the competitor's product")
+class DistributionChannel(TypedDict):
+    distribution_model: Annotated[DistributionModelEnum, Field(description="The distribution model of the competitor's product")]
+    distribution_model_justification: Annotated[str, Field(description="The justification for the distribution model of the competitor's product")]
+    target_channels: Annotated[list[TargetChannelEnum], Field(description="The target channels of the competitor's product")]
 
 class CompetitorProduct(BaseModel):
+    model_config = ConfigDict(revalidate_instances='never', extra='ignore')
     product_name: str = Field(description="The name of the product")
     product_url: str = Field(description="The URL of the product. With the 'https://' or 'http://'")
     product_description: str = Field(description="The description of the product")
@@ -76,6 +97,7 @@ class CompetitorProduct(BaseModel):
     customer_sentiment: CompetitorProductCustomerSentiment = Field(description="The customer sentiment of the competitor's product")
 
 class CompetitorOverview(BaseModel):
+    model_config = ConfigDict(revalidate_instances='never', extra='ignore')
     competitor_mission_statement: str = Field(description="The mission statement of the competitor")
     competitor_vision_statement: str = Field(description="The vision statement of the competitor")
     competitor_company_culture_and_values: str = Field(description="The company culture and values of the competitor")
@@ -84,6 +106,7 @@ class CompetitorOverview(BaseModel):
     competitor_sources: list[str] = Field(description="The sources of the data")
 
 class CompetitorAnalysis(BaseModel):
+    model_config = ConfigDict(revalidate_instances='never', extra='ignore')
     company_headquarters_location: str = Field(description="The headquarters location of the competitor")
     number_of_employees: int = Field(description="The number of employees of the competitor")
     website_url: str = Field(description="The website URL of the competitor's home page. With the 'https://' or 'http://'")
@@ -99,10 +122,162 @@ class CompetitorAnalysis(BaseModel):
     sources: list[str] = Field(description="The sources of the data")
 
 
+# Per-call prompt templates, tokenized once at import into render callables
+_render_find_competitors_prompt = compile_prompt(find_competitors_prompt)
+_render_find_competitors_fast_prompt = compile_prompt(find_competitors_fast_prompt)
+_render_competitor_analysis_swarm_prompt = compile_prompt(competitor_analysis_swarm_prompt)
+
+
+# TypeAdapters compile a pydantic-core validator/schema on construction, so
+# build them once at module scope and reuse them for schema generation and
+# any validated parse instead of re-resolving the types per call
+_FIND_COMPETITORS_ADAPTER = TypeAdapter(FindCompetitorsOutput)
+_COMPETITOR_OVERVIEW_ADAPTER = TypeAdapter(CompetitorOverview)
+_COMPETITOR_ANALYSIS_ADAPTER = TypeAdapter(CompetitorAnalysis)
+_ADAPTERS_BY_MODEL = {
+    FindCompetitorsOutput: _FIND_COMPETITORS_ADAPTER,
+    CompetitorOverview: _COMPETITOR_OVERVIEW_ADAPTER,
+    CompetitorAnalysis: _COMPETITOR_ANALYSIS_ADAPTER,
+}
+
+# The schema is invariant, so generate it once at import time instead of on every competitor_analysis call
+_COMPETITOR_ANALYSIS_SCHEMA = json.dumps(_COMPETITOR_ANALYSIS_ADAPTER.json_schema())
+
+
+def _parse(cls: type[BaseModel], raw: str, validate: bool = False) -> BaseModel:
+    """
+    Parse a model straight from the raw LLM response text.
+    Strips markdown code fences, then either validates in a single pass via the
+    model's precompiled TypeAdapter, or (default) decodes with orjson when
+    available and hands the trusted dict off to _fast_construct.
+    Args:
+        cls: The BaseModel subclass to build
+        raw: The raw response text containing JSON
+        validate: Whether to run full Pydantic validation on the data
+    """
+    cleaned = raw.strip().removeprefix("```json").removeprefix("```").removesuffix("```")
+    if validate:
+        return _ADAPTERS_BY_MODEL[cls].validate_json(cleaned)
+    parsed = orjson.loads(cleaned) if orjson is not None else json.loads(cleaned)
+    if not isinstance(parsed, dict):
+        raise json.JSONDecodeError("Expected a JSON object", cleaned, 0)
+    return _fast_construct(cls, parsed)
+
+
+def _fast_construct(cls: type[BaseModel], data: dict) -> BaseModel:
+    """
+    Build a model from trusted data without running field validation.
+    The LLM output has already been shaped by the JSON schema in the prompt,
+    so model_construct avoids re-validating every nested field.
+    Args:
+        cls: The BaseModel subclass to build
+        data: The trusted dict to build the model from
+    """
+    values = {}
+    for name, field in cls.model_fields.items():
+        if name not in data:
+            continue
+        value = data[name]
+        annotation = field.annotation
+        if get_origin(annotation) is list:
+            item_type = get_args(annotation)[0]
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel) and isinstance(value, list):
+                value = [_fast_construct(item_type, item) for item in value]
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+            value = _fast_construct(annotation, value)
+        values[name] = value
+    return cls.model_construct(**values)
+
+
+class ToolError(BaseModel):
+    model_config = ConfigDict(revalidate_instances='never', extra='ignore')
+    error: str = Field(description="The error message")
+    tool: str = Field(description="The tool that raised the error")
+    retryable: bool = Field(description="Whether retrying the tool call may succeed", default=False)
+
+
 class CompetitiveResearch:
-    def __init__(self, company_information: str, logger: logging.Logger):
+    # Model routing per task. The entry/overview node and the top-level tools
+    # keep the stronger model since they assemble the full structured output;
+    # the focused researcher nodes produce short findings consumed by another
+    # LLM, so a cheaper/faster model is sufficient.
+    _MODEL_BY_TASK = {
+        "find": "us.amazon.nova-pro-v1:0",
+        "find_fast": "us.amazon.nova-micro-v1:0",
+        "analysis": "us.amazon.nova-pro-v1:0",
+        "overview": "us.amazon.nova-pro-v1:0",
+        "pricing": "us.amazon.nova-lite-v1:0",
+        "distribution": "us.amazon.nova-lite-v1:0",
+        "publicity": "us.amazon.nova-lite-v1:0",
+    }
+
+    def __init__(self, company_information: str, logger: logging.Logger, latency_optimized: bool = True, prompt_caching: bool = True):
         self.company_information = company_information
         self.logger = logger
+        self.latency_optimized = latency_optimized
+        self.prompt_caching = prompt_caching
+        # company_information is stable across requests, so the rendered system
+        # prompt is cached per process rather than rebuilt per instance
+        self._find_competitors_system_prompt = render_find_competitors_system_prompt(company_information)
+        self._agents: dict[str, Agent] = {}
+        self._agents_lock = threading.Lock()
+        # Research results keyed on (tool_name, normalized competitor URL) so
+        # repeated analysis of the same competitor skips the Bedrock/Tavily
+        # round-trips; TTL-bounded so stale research eventually refreshes
+        self._cache = TtlCache(maxsize=2048, ttl=6 * 3600)
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        # Raw Tavily responses shared across researcher agents, keyed by query/URL
+        self._tavily_cache: dict[tuple, object] = {}
+        # Build the research tool list once so Strands introspects the
+        # signatures and builds tool schemas a single time, not per call
+        self._research_tools = self._cached_tavily_tools()
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """
+        Normalize a competitor URL for cache keying (lowercase host, no trailing slash).
+        Args:
+            url: The competitor URL to normalize
+        """
+        parsed = urlparse(url.strip())
+        return parsed._replace(netloc=parsed.netloc.lower(), path=parsed.path.rstrip("/")).geturl()
+
+    def _get_agent(self, agent_key: str, model_id: str, system_prompt: str, tools: list) -> Agent:
+        """
+        Return a memoized Agent, building it on first use.
+        Args:
+            agent_key: Cache key identifying the agent's role
+            model_id: The Bedrock model ID to use
+            system_prompt: The system prompt for the agent
+            tools: The tools to register on the agent
+        """
+        with self._agents_lock:
+            agent_instance = self._agents.get(agent_key)
+            if agent_instance is None:
+                agent_instance = Agent(
+                    model=self._bedrock(model_id, max_tokens=10000, temperature=0),
+                    system_prompt=system_prompt,
+                    tools=tools
+                )
+                self._agents[agent_key] = agent_instance
+            return agent_instance
+
+    def _bedrock(self, model_id: str, **kwargs) -> BedrockModel:
+        """
+        Build a BedrockModel, enabling latency-optimized inference when supported.
+        Args:
+            model_id: The Bedrock model ID to use
+            **kwargs: Additional keyword arguments passed through to BedrockModel
+        """
+        if self.latency_optimized:
+            kwargs.setdefault("additional_request_fields", {"performanceConfig": {"latency": "optimized"}})
+        if self.prompt_caching:
+            # The system prompt is identical across the dozens of calls in a
+            # research run, so a cache point on it makes every call after the
+            # first reuse the prefill instead of re-encoding it
+            kwargs.setdefault("cache_prompt", "default")
+        return BedrockModel(model_id=model_id, **kwargs)
 
     @tool
     def find_competitors(self, num_competitors: int) -> FindCompetitorsOutput:
@@ -112,16 +287,127 @@ class CompetitiveResearch:
             num_competitors: The number of competitors to find
         """
         try:
-            agent_instance = Agent(
-                model=BedrockModel(model_id="us.amazon.nova-pro-v1:0", max_tokens=10000, temperature=0),
-                system_prompt=find_competitors_system_prompt.format(company_information=self.company_information),
-                tools=[think, tavily_search, tavily_crawl, tavily_extract]
+            if num_competitors <= 3:
+                return self._find_competitors_fast(num_competitors)
+            agent_instance = self._get_agent(
+                "find_competitors",
+                self._MODEL_BY_TASK["find"],
+                self._find_competitors_system_prompt,
+                [think, *self._research_tools]
             )
-            response = agent_instance.structured_output(FindCompetitorsOutput, find_competitors_prompt.format(num_competitors=num_competitors))
+            response = agent_instance.structured_output(FindCompetitorsOutput, _render_find_competitors_prompt(num_competitors=num_competitors))
             return response
         except Exception as e:
             self.logger.error(f"Error finding competitors: {str(e)}")
-            return f"Error finding competitors: {str(e)}"
+            return ToolError(error=str(e), tool="find_competitors", retryable=isinstance(e, TimeoutError))
+
+    def _find_competitors_fast(self, num_competitors: int) -> FindCompetitorsOutput:
+        """
+        Lightweight path for small competitor counts: one Tavily search plus a
+        single cheap structured-output call to filter and verify the results,
+        skipping the full tool-using research agent.
+        Args:
+            num_competitors: The number of competitors to find
+        """
+        search_results = _tavily_search(query=f"top competitors of: {self.company_information[:400]}", max_results=num_competitors * 3)
+        agent_instance = self._get_agent(
+            "find_competitors_fast",
+            self._MODEL_BY_TASK["find_fast"],
+            self._find_competitors_system_prompt,
+            []
+        )
+        return agent_instance.structured_output(FindCompetitorsOutput, _render_find_competitors_fast_prompt(num_competitors=num_competitors, search_results=search_results))
+
+    def _cached_tavily_tools(self) -> list:
+        """
+        Build Tavily tool wrappers sharing a per-instance cache, so a query or
+        URL fetched by one researcher agent is not re-fetched by the others.
+
+        The wrappers register under the original tool names, which is what the
+        swarm system prompts instruct the agents to call. They deliberately
+        expose only the parameters those prompts exercise so that equivalent
+        calls collapse onto one cache entry.
+        """
+        cache = self._tavily_cache
+
+        @tool(name="tavily_search")
+        def cached_tavily_search(query: str, max_results: int = 5) -> object:
+            """
+            Search the web for a query using Tavily.
+            Args:
+                query: The search query
+                max_results: The maximum number of results to return
+            """
+            key = ("search", query, max_results)
+            if key not in cache:
+                cache[key] = _tavily_search(query=query, max_results=max_results)
+            return cache[key]
+
+        @tool(name="tavily_crawl")
+        def cached_tavily_crawl(url: str) -> object:
+            """
+            Crawl a website starting from the given URL using Tavily.
+            Args:
+                url: The URL to start crawling from
+            """
+            key = ("crawl", url)
+            if key not in cache:
+                cache[key] = _tavily_crawl(url=url)
+            return cache[key]
+
+        @tool(name="tavily_extract")
+        def cached_tavily_extract(urls: str) -> object:
+            """
+            Extract page content from the given URL using Tavily.
+            Args:
+                urls: The URL to extract content from
+            """
+            key = ("extract", urls)
+            if key not in cache:
+                cache[key] = _tavily_extract(urls=urls)
+            return cache[key]
+
+        return [cached_tavily_search, cached_tavily_crawl, cached_tavily_extract]
+
+    def _build_analysis_swarm(self) -> Swarm:
+        """
+        Build the competitor analysis swarm of researcher agents.
+        """
+        tavily_tools = self._research_tools
+        company_overview_agent = Agent(
+            name="Company Overview Researcher",
+            model=self._bedrock(self._MODEL_BY_TASK["overview"], max_tokens=10000, temperature=0),
+            system_prompt=competitor_overview_swarm_system_prompt,
+            tools=tavily_tools
+        )
+        product_researcher_agent = Agent(
+            name="Product/Pricing Researcher",
+            model=self._bedrock(self._MODEL_BY_TASK["pricing"], max_tokens=10000, temperature=0),
+            system_prompt=product_researcher_swarm_system_prompt,
+            tools=tavily_tools
+        )
+        distribution_researcher_agent = Agent(
+            name="Distribution/Target Audience Researcher",
+            model=self._bedrock(self._MODEL_BY_TASK["distribution"], max_tokens=10000, temperature=0),
+            system_prompt=distribution_researcher_swarm_system_prompt,
+            tools=tavily_tools
+        )
+        publicity_researcher_agent = Agent(
+            name="Publicity/Sentiment Researcher",
+            model=self._bedrock(self._MODEL_BY_TASK["publicity"], max_tokens=10000, temperature=0),
+            system_prompt=publicity_researcher_swarm_system_prompt,
+            tools=tavily_tools
+        )
+        return Swarm(
+            [company_overview_agent, product_researcher_agent, distribution_researcher_agent, publicity_researcher_agent],
+            entry_point=company_overview_agent,
+            max_handoffs=20,
+            max_iterations=5,
+            execution_timeout=180,
+            node_timeout=180,
+            repetitive_handoff_detection_window=8,
+            repetitive_handoff_min_unique_agents=1
+        )
 
     @tool
     def competitor_analysis(self, competitor_name: str, competitor_url: str) -> CompetitorAnalysis:
@@ -131,53 +417,124 @@ class CompetitiveResearch:
             competitor_name: The name of the competitor
             competitor_url: The URL of the competitor's product
         """
+        cache_key = ("competitor_analysis", self._normalize_url(competitor_url))
+        hit = self._cache.lookup(cache_key)
+        if hit is not None:
+            result, stale = hit
+            if stale:
+                # Stale-while-revalidate: serve the cached analysis now and refresh it in the background
+                threading.Thread(target=self._refresh_analysis, args=(competitor_name, competitor_url), daemon=True).start()
+            return result
         try:
-            company_overview_agent = Agent(
-                name="Company Overview Researcher",
-                model=BedrockModel(model_id="us.amazon.nova-pro-v1:0", max_tokens=10000, temperature=0),
-                system_prompt=competitor_overview_swarm_system_prompt,
-                tools=[tavily_search, tavily_crawl, tavily_extract]
-            )
-            product_researcher_agent = Agent(
-                name="Product/Pricing Researcher",
-                model=BedrockModel(model_id="us.amazon.nova-pro-v1:0", max_tokens=10000, temperature=0),
-                system_prompt=product_researcher_swarm_system_prompt,
-                tools=[tavily_search, tavily_crawl, tavily_extract]
-            )
-            distribution_researcher_agent = Agent(
-                name="Distribution/Target Audience Researcher",
-                model=BedrockModel(model_id="us.amazon.nova-pro-v1:0", max_tokens=10000, temperature=0),
-                system_prompt=distribution_researcher_swarm_system_prompt,
-                tools=[tavily_search, tavily_crawl, tavily_extract]
-            )
-            publicity_researcher_agent = Agent(
-                name="Publicity/Sentiment Researcher",
-                model=BedrockModel(model_id="us.amazon.nova-pro-v1:0", max_tokens=10000, temperature=0),
-                system_prompt=publicity_researcher_swarm_system_prompt,
-                tools=[tavily_search, tavily_crawl, tavily_extract]
-            )
-            competitive_analysis_swarm = Swarm(
-                [company_overview_agent, product_researcher_agent, distribution_researcher_agent, publicity_researcher_agent],
-                entry_point=company_overview_agent,
-                max_handoffs=20,
-                max_iterations=5,
-                execution_timeout=180,
-                node_timeout=180,
-                repetitive_handoff_detection_window=8,
-                repetitive_handoff_min_unique_agents=1
-            )
-            response = competitive_analysis_swarm(competitor_analysis_swarm_prompt.format(company_information=self.company_information, competitor_name=competitor_name, competitor_url=competitor_url, output_schema=CompetitorAnalysis.model_json_schema()))
-            if response.node_history:
-                last_agent = response.node_history[-1]
-                last_node_result = response.results[last_agent.node_id]
-                agent_result = last_node_result.result
-
-                final_text = str(agent_result)
-                self.logger.info(f"Competitor analysis COMPLETED----------------------------------------------: {final_text}")
-                return final_text
-            else:
-                self.logger.error(f"Error analyzing competitor: {response}")
-                return f"Error analyzing competitor: {response}"
+            competitive_analysis_swarm = self._build_analysis_swarm()
+            response = competitive_analysis_swarm(_render_competitor_analysis_swarm_prompt(company_information=self.company_information, competitor_name=competitor_name, competitor_url=competitor_url, output_schema=_COMPETITOR_ANALYSIS_SCHEMA))
+            return self._handle_swarm_response(response, cache_key)
         except Exception as e:
             self.logger.error(f"Error analyzing competitor: {str(e)}")
-            return f"Error analyzing competitor: {str(e)}"
\ No newline at end of file
+            return ToolError(error=str(e), tool="competitor_analysis", retryable=isinstance(e, TimeoutError))
+
+    def _handle_swarm_response(self, response, cache_key: tuple[str, str]):
+        """
+        Extract, parse and cache the final result from a swarm response.
+        Args:
+            response: The swarm response
+            cache_key: The cache key to store a successful result under
+        """
+        if response.node_history:
+            last_agent = response.node_history[-1]
+            last_node_result = response.results[last_agent.node_id]
+            final_text = str(last_node_result.result)
+            self.logger.info(f"Competitor analysis COMPLETED----------------------------------------------: {final_text}")
+            try:
+                result = _parse(CompetitorAnalysis, final_text)
+            except (json.JSONDecodeError, ValueError):
+                result = final_text
+            self._cache.store(cache_key, result)
+            return result
+        self.logger.error(f"Error analyzing competitor: {response}")
+        return ToolError(error=f"Swarm returned no results: {response}", tool="competitor_analysis", retryable=True)
+
+    def _refresh_analysis(self, competitor_name: str, competitor_url: str) -> None:
+        """
+        Background refresh of a stale cached analysis (stale-while-revalidate).
+        Args:
+            competitor_name: The name of the competitor
+            competitor_url: The URL of the competitor's product
+        """
+        cache_key = ("competitor_analysis", self._normalize_url(competitor_url))
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+        try:
+            competitive_analysis_swarm = self._build_analysis_swarm()
+            response = competitive_analysis_swarm(_render_competitor_analysis_swarm_prompt(company_information=self.company_information, competitor_name=competitor_name, competitor_url=competitor_url, output_schema=_COMPETITOR_ANALYSIS_SCHEMA))
+            self._handle_swarm_response(response, cache_key)
+        except Exception as e:
+            self.logger.error(f"Error refreshing competitor analysis: {str(e)}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(cache_key)
+
+    async def competitor_analysis_stream(self, competitor_name: str, competitor_url: str):
+        """
+        Async variant of competitor_analysis that yields results as they become available.
+
+        The swarm only surfaces node-level completion, so this yields a progress
+        marker up front and the parsed analysis as soon as the final node finishes,
+        letting the API layer forward partial state over SSE/WebSocket instead of
+        blocking the event loop on the full response.
+        Args:
+            competitor_name: The name of the competitor
+            competitor_url: The URL of the competitor's product
+        """
+        cache_key = ("competitor_analysis", self._normalize_url(competitor_url))
+        hit = self._cache.lookup(cache_key)
+        if hit is not None:
+            yield hit[0]
+            return
+        yield {"status": "analyzing", "competitor_name": competitor_name, "competitor_url": competitor_url}
+        yield await self._competitor_analysis_async(competitor_name, competitor_url)
+
+    async def _competitor_analysis_async(self, competitor_name: str, competitor_url: str):
+        """
+        Run one competitor analysis swarm asynchronously, with caching.
+        Args:
+            competitor_name: The name of the competitor
+            competitor_url: The URL of the competitor's product
+        """
+        cache_key = ("competitor_analysis", self._normalize_url(competitor_url))
+        hit = self._cache.lookup(cache_key)
+        if hit is not None:
+            return hit[0]
+        try:
+            competitive_analysis_swarm = self._build_analysis_swarm()
+            response = await competitive_analysis_swarm.invoke_async(_render_competitor_analysis_swarm_prompt(company_information=self.company_information, competitor_name=competitor_name, competitor_url=competitor_url, output_schema=_COMPETITOR_ANALYSIS_SCHEMA))
+            return self._handle_swarm_response(response, cache_key)
+        except Exception as e:
+            self.logger.error(f"Error analyzing competitor: {str(e)}")
+            return ToolError(error=str(e), tool="competitor_analysis", retryable=isinstance(e, TimeoutError))
+
+    # Concurrent swarms multiply Tavily/Bedrock request pressure; beyond a few
+    # in flight the providers start rate limiting and retries erase the win
+    _MAX_CONCURRENT_ANALYSES = 3
+
+    async def analyze_competitors(self, competitors: list[FindCompetitor]) -> list:
+        """
+        Analyze several competitors concurrently.
+
+        Each analysis is dominated by Bedrock and Tavily round-trips, so
+        running them through asyncio.gather collapses end-to-end latency
+        towards the slowest single competitor instead of the sum. A semaphore
+        caps how many swarms run at once so large batches don't trip
+        provider rate limits and stall on retries.
+        Args:
+            competitors: The competitors to analyze
+        """
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_ANALYSES)
+
+        async def analyze(competitor: FindCompetitor):
+            async with semaphore:
+                return await self._competitor_analysis_async(competitor.competitor_name, competitor.competitor_url)
+
+        return list(await asyncio.gather(*(analyze(competitor) for competitor in competitors)))
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .system import system_prompt
-from .find_competitors import find_competitors_system_prompt, find_competitors_prompt
+from ._compiled import compile_prompt, render_system_prompt, render_find_competitors_system_prompt
+from .find_competitors import find_competitors_system_prompt, find_competitors_prompt, find_competitors_fast_prompt
 from .competitor_analysis_swarm import (
     competitor_analysis_swarm_prompt, 
     competitor_overview_swarm_system_prompt, 
@@ -10,8 +11,12 @@ from .competitor_analysis_swarm import (
 
 __all__ = [
     "system_prompt", 
+    "compile_prompt",
+    "render_system_prompt",
+    "render_find_competitors_system_prompt",
     "find_competitors_prompt", 
     "find_competitors_system_prompt",
+    "find_competitors_fast_prompt",
     "competitor_analysis_swarm_prompt",
     "competitor_overview_swarm_system_prompt",
     "product_researcher_swarm_system_prompt",
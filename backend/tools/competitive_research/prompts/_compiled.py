@@ -0,0 +1,68 @@
+"""
+Prompt templates precompiled into render callables.
+
+str.format re-parses the format mini-language on every call; tokenizing a
+template once with string.Formatter lets rendering become a plain join over
+the cached segments.
+"""
+import functools
+import string
+from typing import Callable
+
+from .system import system_prompt
+from .find_competitors import find_competitors_system_prompt
+
+_FORMATTER = string.Formatter()
+
+
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Tokenize a {field}-style prompt template once and return a renderer.
+
+    Args:
+        template: The prompt template with {field} placeholders
+
+    Returns:
+        A callable taking the template fields as keyword arguments
+    """
+    tokens = list(_FORMATTER.parse(template))
+
+    def render(**fields) -> str:
+        parts = []
+        for literal, field_name, _format_spec, _conversion in tokens:
+            if literal:
+                parts.append(literal)
+            if field_name is not None:
+                parts.append(str(fields[field_name]))
+        return "".join(parts)
+
+    return render
+
+
+_render_system_prompt = compile_prompt(system_prompt)
+_render_find_competitors_system_prompt = compile_prompt(find_competitors_system_prompt)
+
+
+@functools.lru_cache(maxsize=64)
+def render_system_prompt(company_information: str) -> str:
+    """
+    Render the researcher system prompt for a company, cached per process.
+
+    The company information is stable across agent turns, so the rendered
+    prompt is built once per company instead of on every request.
+
+    Args:
+        company_information: The company the research is being done for
+    """
+    return _render_system_prompt(company_information=company_information)
+
+
+@functools.lru_cache(maxsize=64)
+def render_find_competitors_system_prompt(company_information: str) -> str:
+    """
+    Render the find-competitors system prompt for a company, cached per process.
+
+    Args:
+        company_information: The company the research is being done for
+    """
+    return _render_find_competitors_system_prompt(company_information=company_information)
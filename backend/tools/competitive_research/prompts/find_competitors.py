@@ -41,4 +41,17 @@ find_competitors_prompt = """# Your Tasks
 - If the competitor's website URL can not be located do not include them in the results
 
 number of competitors to find: {num_competitors}
-"""
\ No newline at end of file
+"""
+find_competitors_fast_prompt = """# Your Tasks
+Given the following web search results, select the {num_competitors} most relevant competitors for your company.
+
+# Requirements
+- Only include companies whose official home page URL appears in the search results
+- Ensure the competitor's website URL is valid and is actually the competitor's home page
+- If the competitor's website URL can not be located do not include them in the results
+
+# Search Results
+{search_results}
+
+number of competitors to select: {num_competitors}
+"""
@@ -3,7 +3,22 @@ from .types import (
     NotificationType,
     SeverityType,
     ElementIdType,
-    ChartType
+    ChartType,
+    MessageTypeEnum,
+    NotificationTypeEnum,
+    SeverityTypeEnum,
+    ElementIdTypeEnum,
+    ChartTypeEnum,
+    MESSAGE_TYPE_NAMES,
+    NOTIFICATION_TYPE_NAMES,
+    SEVERITY_TYPE_NAMES,
+    ELEMENT_ID_TYPE_NAMES,
+    CHART_TYPE_NAMES,
+    MESSAGE_TYPE_VALUES,
+    NOTIFICATION_TYPE_VALUES,
+    SEVERITY_TYPE_VALUES,
+    ELEMENT_ID_TYPE_VALUES,
+    CHART_TYPE_VALUES
 )
 
 __all__ = [
@@ -11,5 +26,20 @@ __all__ = [
     "NotificationType",
     "SeverityType",
     "ElementIdType",
-    "ChartType"
+    "ChartType",
+    "MessageTypeEnum",
+    "NotificationTypeEnum",
+    "SeverityTypeEnum",
+    "ElementIdTypeEnum",
+    "ChartTypeEnum",
+    "MESSAGE_TYPE_NAMES",
+    "NOTIFICATION_TYPE_NAMES",
+    "SEVERITY_TYPE_NAMES",
+    "ELEMENT_ID_TYPE_NAMES",
+    "CHART_TYPE_NAMES",
+    "MESSAGE_TYPE_VALUES",
+    "NOTIFICATION_TYPE_VALUES",
+    "SEVERITY_TYPE_VALUES",
+    "ELEMENT_ID_TYPE_VALUES",
+    "CHART_TYPE_VALUES"
 ]
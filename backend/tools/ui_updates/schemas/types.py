@@ -1,6 +1,8 @@
 """
 Type definitions for UI updates.
 """
+import sys
+from enum import IntEnum
 from typing import Literal
 
 # Message types for WebSocket communication
@@ -29,3 +31,84 @@ ElementIdType = Literal[
 
 # Chart types
 ChartType = Literal["scatter", "bar", "line", "radar", "pie", "doughnut", "bubble"]
+
+
+# Compact integer codes paralleling the Literal aliases above. Dispatch code
+# can compare and index on these instead of strings; the Literal aliases stay
+# the wire/API representation so the frontend contract is unchanged.
+# NAMES tuples map a code back to its string in O(1): NAMES[code].
+
+class MessageTypeEnum(IntEnum):
+    SHOW_COMPETITOR_CONTEXT = 0
+    SHOW_INSIGHT = 1
+    SHOW_NOTIFICATION = 2
+    SHOW_PROGRESS = 3
+    HIGHLIGHT_ELEMENT = 4
+    SHOW_GRAPH = 5
+
+
+MESSAGE_TYPE_NAMES: tuple[str, ...] = (
+    "show_competitor_context",
+    "show_insight",
+    "show_notification",
+    "show_progress",
+    "highlight_element",
+    "show_graph"
+)
+
+
+class NotificationTypeEnum(IntEnum):
+    INFO = 0
+    SUCCESS = 1
+    WARNING = 2
+    ERROR = 3
+
+
+NOTIFICATION_TYPE_NAMES: tuple[str, ...] = ("info", "success", "warning", "error")
+
+
+class SeverityTypeEnum(IntEnum):
+    INFO = 0
+    SUCCESS = 1
+    WARNING = 2
+
+
+SEVERITY_TYPE_NAMES: tuple[str, ...] = ("info", "success", "warning")
+
+
+class ElementIdTypeEnum(IntEnum):
+    CHAT_INTERFACE = 0
+    INSIGHTS_PANEL = 1
+    DYNAMIC_UI_OVERLAY = 2
+    COMPETITOR_CAROUSEL_MINIMIZED = 3
+
+
+ELEMENT_ID_TYPE_NAMES: tuple[str, ...] = (
+    "chat-interface",
+    "insights-panel",
+    "dynamic-ui-overlay",
+    "competitor-carousel-minimized"
+)
+
+
+class ChartTypeEnum(IntEnum):
+    SCATTER = 0
+    BAR = 1
+    LINE = 2
+    RADAR = 3
+    PIE = 4
+    DOUGHNUT = 5
+    BUBBLE = 6
+
+
+CHART_TYPE_NAMES: tuple[str, ...] = ("scatter", "bar", "line", "radar", "pie", "doughnut", "bubble")
+
+
+# Interned value sets for the Literal aliases. Interning incoming strings once
+# at the ingress/egress boundary lets downstream dispatch use pointer compares
+# instead of character-by-character string comparison.
+MESSAGE_TYPE_VALUES: frozenset = frozenset(sys.intern(v) for v in MESSAGE_TYPE_NAMES)
+NOTIFICATION_TYPE_VALUES: frozenset = frozenset(sys.intern(v) for v in NOTIFICATION_TYPE_NAMES)
+SEVERITY_TYPE_VALUES: frozenset = frozenset(sys.intern(v) for v in SEVERITY_TYPE_NAMES)
+ELEMENT_ID_TYPE_VALUES: frozenset = frozenset(sys.intern(v) for v in ELEMENT_ID_TYPE_NAMES)
+CHART_TYPE_VALUES: frozenset = frozenset(sys.intern(v) for v in CHART_TYPE_NAMES)
@@ -2,10 +2,122 @@
 UI Updates tools for sending real-time updates to the frontend dashboard.
 """
 import logging
+import sys
+import threading
+from collections import deque
+from operator import itemgetter
 from typing import Dict, Any, Optional
 from strands import tool
-from websocket_helper import send_ui_update_to_identity
-from .schemas.types import NotificationType, SeverityType, ElementIdType
+from .schemas.types import NotificationType, SeverityType, ElementIdType, MESSAGE_TYPE_VALUES
+
+
+# The frontend renders short previews of these free-text fields; bounding
+# them here keeps one verbose LLM emission from producing an oversized frame
+_MAX_FIELD_LEN = {
+    "mission_statement": 512,
+    "vision_statement": 512,
+    "company_culture_and_values": 768,
+    "description": 1024,
+    "notes": 2048,
+}
+_MAX_PRODUCT_DESCRIPTION_LEN = 1024
+
+
+def _truncate_long_fields(competitors: list) -> None:
+    """
+    Clamp oversized free-text fields on competitor dicts in place.
+
+    Args:
+        competitors: Competitor dicts as passed to show_competitors
+    """
+    for competitor in competitors:
+        if not isinstance(competitor, dict):
+            continue
+        for key, max_len in _MAX_FIELD_LEN.items():
+            value = competitor.get(key)
+            if isinstance(value, str) and len(value) > max_len:
+                competitor[key] = value[:max_len - 1] + "…"
+        for product in competitor.get("products") or ():
+            if isinstance(product, dict):
+                value = product.get("product_description")
+                if isinstance(value, str) and len(value) > _MAX_PRODUCT_DESCRIPTION_LEN:
+                    product["product_description"] = value[:_MAX_PRODUCT_DESCRIPTION_LEN - 1] + "…"
+
+
+# Shared read-only Chart.js plugin blocks. Every graph payload references the
+# same object; the serializer only reads them, so never mutate these in place
+_PLUGINS_LEGEND_TOP = {"legend": {"display": True, "position": "top"}}
+_PLUGINS_LEGEND_RIGHT = {"legend": {"display": True, "position": "right"}}
+
+# Pulls the four required bubble-point fields in one C-level call
+_BUBBLE_POINT_FIELDS = itemgetter("x", "y", "r", "label")
+
+# Groups drawn with a larger point radius on scatter charts. "Your Company"
+# is the documented fixed group identifier for the user's own company
+_EMPHASIZED_GROUPS = frozenset({"Your Company"})
+
+_INTERNED_STRINGS: Dict[str, str] = {}
+
+
+def _intern_str(value):
+    """
+    Return a process-wide shared copy of value when it is a string.
+
+    Enum-like values ("Direct Competitors", severity levels, hex colors)
+    repeat across many insight and dataset dicts; sharing one object per
+    distinct value shrinks resident payloads and speeds later dict hashing.
+
+    Args:
+        value: A candidate string (non-strings pass through untouched)
+    """
+    if isinstance(value, str):
+        return _INTERNED_STRINGS.setdefault(value, sys.intern(value))
+    return value
+
+
+def _intern_fields(items: list, keys: tuple) -> None:
+    """
+    Intern the given repeated string fields across a list of dicts in place.
+
+    Args:
+        items: Dicts to rewrite (insights or Chart.js datasets)
+        keys: Field names whose values repeat across items
+    """
+    for item in items:
+        for key in keys:
+            value = item.get(key)
+            if type(value) is str:
+                item[key] = _intern_str(value)
+
+
+def _axes_options(
+    x_axis_label: str,
+    y_axis_label: str,
+    x_range: Optional[tuple] = None,
+    y_range: Optional[tuple] = None
+) -> Dict[str, Any]:
+    """
+    Build the Chart.js options tree shared by the x/y-axis graph tools.
+
+    The scatter, bar and line tools previously rebuilt this identical nested
+    skeleton inline; only the axis titles and optional ranges vary per call.
+
+    Args:
+        x_axis_label: Title text for the x axis
+        y_axis_label: Title text for the y axis
+        x_range: Optional (min, max) for the x axis
+        y_range: Optional (min, max) for the y axis
+    """
+    x_axis: Dict[str, Any] = {"title": {"display": True, "text": x_axis_label}}
+    y_axis: Dict[str, Any] = {"title": {"display": True, "text": y_axis_label}}
+    if x_range is not None:
+        x_axis["min"], x_axis["max"] = x_range
+    if y_range is not None:
+        y_axis["min"], y_axis["max"] = y_range
+    return {
+        "scales": {"x": x_axis, "y": y_axis},
+        "plugins": _PLUGINS_LEGEND_TOP
+    }
 
 
 class UIUpdates:
@@ -18,8 +130,13 @@ class UIUpdates:
     COLOR_ACCENT_PINK = "#ec4899"    # Pink - accent color
     COLOR_NEUTRAL = "#cccccc"      # Gray - neutral, "others" category
 
-    # Default color palette for charts and visualizations
-    DEFAULT_COLOR_PALETTE = [COLOR_SUCCESS, COLOR_WARNING, COLOR_INFO, COLOR_PRIMARY, COLOR_ACCENT_PURPLE, COLOR_ACCENT_PINK, COLOR_NEUTRAL]
+    # Default color palette for charts and visualizations. A tuple so the
+    # shared default is immutable and never copied per call
+    DEFAULT_COLOR_PALETTE = (COLOR_SUCCESS, COLOR_WARNING, COLOR_INFO, COLOR_PRIMARY, COLOR_ACCENT_PURPLE, COLOR_ACCENT_PINK, COLOR_NEUTRAL)
+
+    # Updates emitted within this window are coalesced into one WebSocket frame
+    FLUSH_INTERVAL_SECONDS = 0.02
+    MAX_BATCH_SIZE = 128
 
     def __init__(self, identity_id: str, logger: logging.Logger):
         """
@@ -31,6 +148,19 @@ class UIUpdates:
         """
         self.identity_id = identity_id
         self.logger = logger
+        self._pending_updates: deque = deque()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        if not identity_id:
+            # identity_id never changes after construction, so bind the
+            # no-session short-circuit once instead of branching per tool call
+            self._send_update = self._send_update_no_session
+            self._send_fn = None
+        else:
+            # Imported here rather than at module top: websocket_helper pulls
+            # in boto3, which sessionless instances never need at cold start
+            from websocket_helper import send_ui_update_to_identity
+            self._send_fn = send_ui_update_to_identity
 
     def _send_update(self, message_type: str, payload: Dict[str, Any]) -> str:
         """
@@ -43,19 +173,65 @@ class UIUpdates:
         Returns:
             Success or error message
         """
-        if not self.identity_id:
-            return "Error: No active user session for WebSocket updates"
+        # Intern once at the egress boundary so downstream dispatch can rely
+        # on identity compares against the interned value set
+        message_type = sys.intern(message_type)
+        if message_type not in MESSAGE_TYPE_VALUES:
+            return f"Error: Unknown message type: {message_type}"
+
+        # Coalesce bursts of related updates (e.g. SWOT insight + two graphs)
+        # into a single WebSocket frame instead of one send per tool call
+        flush_now = False
+        with self._flush_lock:
+            self._pending_updates.append({"type": message_type, "payload": payload})
+            if len(self._pending_updates) >= self.MAX_BATCH_SIZE:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                flush_now = True
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL_SECONDS, self._flush_pending_updates)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if flush_now:
+            # Size-capped flushes also run off the agent thread so the tool
+            # returns to the model without waiting on the network round-trip
+            threading.Thread(target=self._flush_pending_updates, daemon=True).start()
+
+        return f"UI update queued for delivery: {message_type}"
+
+    def _send_update_no_session(self, message_type: str, payload: Dict[str, Any]) -> str:
+        """
+        Stand-in for _send_update when no identity_id was provided.
 
-        try:
-            success = send_ui_update_to_identity(self.identity_id, message_type, payload)
+        Args:
+            message_type: Type of message that would have been sent
+            payload: Message payload (ignored)
+        """
+        return "Error: No active user session for WebSocket updates"
 
-            if success:
-                return f"UI update sent successfully: {message_type}"
-            else:
-                return f"Failed to send UI update (user may not have active WebSocket connection): {message_type}"
+    def _flush_pending_updates(self) -> None:
+        """
+        Send all queued updates as a single WebSocket frame.
+
+        A lone update keeps its original message type on the wire; multiple
+        updates are wrapped in one batch_ui_update envelope.
+        """
+        with self._flush_lock:
+            self._flush_timer = None
+            if not self._pending_updates:
+                return
+            updates = list(self._pending_updates)
+            self._pending_updates.clear()
 
+        try:
+            if len(updates) == 1:
+                self._send_fn(self.identity_id, updates[0]["type"], updates[0]["payload"])
+            else:
+                self._send_fn(self.identity_id, "batch_ui_update", {"updates": updates})
         except Exception as e:
-            return f"Error sending UI update: {str(e)}"
+            self.logger.error(f"Error sending UI update batch: {str(e)}")
 
     @tool
     def show_competitors(
@@ -205,6 +381,7 @@ class UIUpdates:
             - The agent will receive an error if required fields are missing
             - Use proper category values: "Direct Competitors", "Indirect Competitors", or "Potential Competitors"
         """
+        _truncate_long_fields(competitors)
         payload = {"competitors": competitors}
         return self._send_update("show_competitor_context", payload)
 
@@ -292,19 +469,17 @@ class UIUpdates:
             - Market positioning findings
         """
         if insights:
-            # Multiple insights in carousel
+            # Multiple insights in carousel; severity/category values repeat
+            # across related insights (e.g. SWOT groups), so share them
+            _intern_fields(insights, ("severity", "category"))
             payload = {"insights": insights}
         else:
-            # Single insight
-            payload = {}
-            if title:
-                payload["title"] = title
-            if content:
-                payload["content"] = content
-            if severity:
-                payload["severity"] = severity
-            if category:
-                payload["category"] = category
+            # Single insight; drop unset fields in one comprehension pass
+            payload = {
+                key: value
+                for key, value in zip(("title", "content", "severity", "category"), (title, content, severity, category))
+                if value
+            }
 
         return self._send_update("show_insight", payload)
 
@@ -384,19 +559,23 @@ class UIUpdates:
             - Include descriptive axis labels with scale explanation
             - Keep scales consistent (often 0-10 or 1-10)
         """
-        # Group data points by group for datasets
+        # Group data points by group for datasets. One dict lookup per point
+        # and the color/radius resolution runs once per group, not per point
         groups = {}
         for point in data_points:
             group_name = point.get("group", "Data Points")
-            if group_name not in groups:
-                groups[group_name] = {
+            group = groups.get(group_name)
+            if group is None:
+                group_name = _intern_str(group_name)
+                color = _intern_str(point.get("color", self.COLOR_PRIMARY))
+                group = groups[group_name] = {
                     "label": group_name,
                     "data": [],
-                    "backgroundColor": point.get("color", self.COLOR_PRIMARY),
-                    "borderColor": point.get("color", self.COLOR_PRIMARY),
-                    "pointRadius": 12 if "Your Company" in group_name else 8
+                    "backgroundColor": color,
+                    "borderColor": color,
+                    "pointRadius": 12 if group_name in _EMPHASIZED_GROUPS else 8
                 }
-            groups[group_name]["data"].append({
+            group["data"].append({
                 "x": point["x"],
                 "y": point["y"],
                 "label": point["label"]
@@ -408,23 +587,7 @@ class UIUpdates:
             "data": {
                 "datasets": list(groups.values())
             },
-            "options": {
-                "scales": {
-                    "x": {
-                        "title": {"display": True, "text": x_axis_label},
-                        "min": x_min,
-                        "max": x_max
-                    },
-                    "y": {
-                        "title": {"display": True, "text": y_axis_label},
-                        "min": y_min,
-                        "max": y_max
-                    }
-                },
-                "plugins": {
-                    "legend": {"display": True, "position": "top"}
-                }
-            }
+            "options": _axes_options(x_axis_label, y_axis_label, (x_min, x_max), (y_min, y_max))
         }
 
         if description:
@@ -501,6 +664,8 @@ class UIUpdates:
             - Use consistent scales (0-10 or 0-100)
             - Include clear axis labels with units
         """
+        _intern_fields(datasets, ("backgroundColor", "borderColor"))
+
         # Detect if this is a simple bar chart (each dataset has exactly one data point)
         # vs a grouped bar chart (multiple data points per dataset)
         is_simple_bar = all(len(dataset.get("data", [])) == 1 for dataset in datasets)
@@ -541,19 +706,7 @@ class UIUpdates:
             "title": title,
             "graphType": "horizontalBar" if horizontal else "bar",
             "data": chart_data,
-            "options": {
-                "scales": {
-                    "x": {
-                        "title": {"display": True, "text": x_axis_label}
-                    },
-                    "y": {
-                        "title": {"display": True, "text": y_axis_label}
-                    }
-                },
-                "plugins": {
-                    "legend": {"display": True, "position": "top"}
-                }
-            }
+            "options": _axes_options(x_axis_label, y_axis_label)
         }
 
         if description:
@@ -643,6 +796,8 @@ class UIUpdates:
             - Include clear axis labels with units
             - Add description to highlight key trends
         """
+        _intern_fields(datasets, ("backgroundColor", "borderColor"))
+
         payload = {
             "title": title,
             "graphType": "line",
@@ -650,19 +805,7 @@ class UIUpdates:
                 "labels": time_periods,
                 "datasets": datasets
             },
-            "options": {
-                "scales": {
-                    "x": {
-                        "title": {"display": True, "text": x_axis_label}
-                    },
-                    "y": {
-                        "title": {"display": True, "text": y_axis_label}
-                    }
-                },
-                "plugins": {
-                    "legend": {"display": True, "position": "top"}
-                }
-            }
+            "options": _axes_options(x_axis_label, y_axis_label)
         }
 
         if description:
@@ -754,6 +897,11 @@ class UIUpdates:
             - Use consistent scales (typically 0-10)
             - Ensure all datasets use same scale
         """
+        # Reject shape mismatches before any network I/O; the frontend can't
+        # render a radar whose series lengths disagree with the axes
+        if any(len(dataset.get("data", ())) != len(dimensions) for dataset in datasets):
+            return "Error: each dataset's data must have one value per dimension"
+
         # Define default color palette for fallback (edge case handling)
         default_colors = [
             {"bg": "rgba(0, 255, 136, 0.2)", "border": self.COLOR_SUCCESS},    # Green
@@ -781,6 +929,8 @@ class UIUpdates:
                     f"borderColor should be provided by the caller."
                 )
 
+        _intern_fields(datasets, ("backgroundColor", "borderColor"))
+
         payload = {
             "title": title,
             "graphType": "radar",
@@ -796,9 +946,7 @@ class UIUpdates:
                         "beginAtZero": True
                     }
                 },
-                "plugins": {
-                    "legend": {"display": True, "position": "top"}
-                }
+                "plugins": _PLUGINS_LEGEND_TOP
             }
         }
 
@@ -883,9 +1031,7 @@ class UIUpdates:
                 }]
             },
             "options": {
-                "plugins": {
-                    "legend": {"display": True, "position": "right"}
-                }
+                "plugins": _PLUGINS_LEGEND_RIGHT
             }
         }
 
@@ -972,9 +1118,7 @@ class UIUpdates:
                 }]
             },
             "options": {
-                "plugins": {
-                    "legend": {"display": True, "position": "right"}
-                }
+                "plugins": _PLUGINS_LEGEND_RIGHT
             }
         }
 
@@ -1063,23 +1207,22 @@ class UIUpdates:
             - Limit to 5-10 bubbles for readability
             - Ensure axis labels are clear and include scale info
         """
-        # Group data points by group for datasets
+        # Group data points by group for datasets, one dict lookup per point
         groups = {}
         for point in data_points:
             group_name = point.get("group", "Data Points")
-            if group_name not in groups:
-                groups[group_name] = {
+            group = groups.get(group_name)
+            if group is None:
+                group_name = _intern_str(group_name)
+                color = _intern_str(point.get("color", self.COLOR_PRIMARY))
+                group = groups[group_name] = {
                     "label": group_name,
                     "data": [],
-                    "backgroundColor": point.get("color", self.COLOR_PRIMARY),
-                    "borderColor": point.get("color", self.COLOR_PRIMARY)
+                    "backgroundColor": color,
+                    "borderColor": color
                 }
-            groups[group_name]["data"].append({
-                "x": point["x"],
-                "y": point["y"],
-                "r": point["r"],
-                "label": point["label"]
-            })
+            x, y, r, label = _BUBBLE_POINT_FIELDS(point)
+            group["data"].append({"x": x, "y": y, "r": r, "label": label})
 
         payload = {
             "title": title,
@@ -1087,23 +1230,7 @@ class UIUpdates:
             "data": {
                 "datasets": list(groups.values())
             },
-            "options": {
-                "scales": {
-                    "x": {
-                        "title": {"display": True, "text": x_axis_label},
-                        "min": x_min,
-                        "max": x_max
-                    },
-                    "y": {
-                        "title": {"display": True, "text": y_axis_label},
-                        "min": y_min,
-                        "max": y_max
-                    }
-                },
-                "plugins": {
-                    "legend": {"display": True, "position": "top"}
-                }
-            }
+            "options": _axes_options(x_axis_label, y_axis_label, (x_min, x_max), (y_min, y_max))
         }
 
         if description:
@@ -1247,7 +1374,8 @@ class UIUpdates:
         }
 
         if percentage is not None:
-            payload["percentage"] = max(0, min(100, percentage))  # Clamp to 0-100
+            # Clamp to 0-100 with conditionals; avoids two call frames per tick
+            payload["percentage"] = 0 if percentage < 0 else 100 if percentage > 100 else percentage
 
         return self._send_update("show_progress", payload)
 
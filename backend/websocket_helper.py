@@ -5,17 +5,39 @@ import boto3
 import json
 import os
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from botocore.config import Config
 from typing import Dict, Any, Optional, Literal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # AWS Configuration
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 AWS_ACCOUNT_ID = os.environ.get('AWS_ACCOUNT_ID', '123456789012')
 
-# DynamoDB and API Gateway clients
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-apigateway_client = boto3.client('apigatewaymanagementapi', region_name=AWS_REGION)
+# DynamoDB resource, created on first use so importing this module doesn't
+# pay for boto3 resource construction in processes that never send updates
+@lru_cache(maxsize=1)
+def _dynamodb():
+    return boto3.resource(
+        'dynamodb',
+        region_name=AWS_REGION,
+        config=Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 3},
+            connect_timeout=1,
+            read_timeout=3
+        )
+    )
 
 # Helper function for consistent table naming
 def get_table_name(base_name: str) -> str:
@@ -38,6 +60,79 @@ WEBSOCKET_API_ID = os.environ.get('WEBSOCKET_API_ID', '')
 WEBSOCKET_ENDPOINT = f"https://{WEBSOCKET_API_ID}.execute-api.{AWS_REGION}.amazonaws.com/prod"
 
 
+# Shared Table handle plus a short-TTL memo of identity -> connection_id so a
+# burst of updates for one user costs a single GSI query instead of one each
+_connections_table = None
+_identity_connection_cache: Dict[str, tuple] = {}
+_IDENTITY_CACHE_TTL_SECONDS = 60.0
+
+# Connections recently reported gone by API Gateway. Skipping these for a
+# short window saves a doomed HTTPS round-trip per send while DynamoDB
+# cleanup and the identity memo catch up
+_gone_connections: Dict[str, float] = {}
+_GONE_TTL_SECONDS = 30.0
+
+
+def _get_connections_table():
+    """
+    Return the shared connections Table handle, creating it on first use.
+    """
+    global _connections_table
+    if _connections_table is None:
+        _connections_table = _dynamodb().Table(CONNECTIONS_TABLE_NAME)
+    return _connections_table
+
+
+def _delete_stale_connection(connection_id: str) -> None:
+    """
+    Remove a stale connection row from DynamoDB, best-effort.
+
+    Args:
+        connection_id: The connection ID reported gone by API Gateway
+    """
+    try:
+        _get_connections_table().delete_item(Key={'connection_id': connection_id})
+    except Exception as cleanup_error:
+        logger.error(f"Error cleaning up stale connection: {str(cleanup_error)}")
+
+
+def _invalidate_connection(connection_id: str) -> None:
+    """
+    Drop any cached identity mappings pointing at a stale connection.
+
+    Args:
+        connection_id: The connection ID reported gone by API Gateway
+    """
+    for identity_id, (cached_id, _cached_at) in list(_identity_connection_cache.items()):
+        if cached_id == connection_id:
+            del _identity_connection_cache[identity_id]
+
+
+# API Gateway Management API client, built once and reused. Client
+# construction parses service models and sets up request signing, which is
+# far too expensive to repeat on every frame
+_apigw_client = None
+
+
+def _get_apigw_client():
+    """
+    Return the shared API Gateway Management API client, creating it on first use.
+    """
+    global _apigw_client
+    if _apigw_client is None:
+        _apigw_client = boto3.client(
+            'apigatewaymanagementapi',
+            endpoint_url=WEBSOCKET_ENDPOINT,
+            region_name=AWS_REGION,
+            config=Config(
+                max_pool_connections=50,
+                tcp_keepalive=True,
+                retries={'mode': 'adaptive', 'max_attempts': 3}
+            )
+        )
+    return _apigw_client
+
+
 MessageType = Literal[
     "show_competitor_context",
     "show_insight",
@@ -45,7 +140,8 @@ MessageType = Literal[
     "update_competitor_panel",
     "show_progress",
     "highlight_element",
-    "show_graph"
+    "show_graph",
+    "batch_ui_update"
 ]
 
 
@@ -59,23 +155,44 @@ def get_connection_id_for_identity(identity_id: str) -> Optional[str]:
     Returns:
         connection_id if found, None otherwise
     """
+    cached = _identity_connection_cache.get(identity_id)
+    if cached is not None and time.time() - cached[1] < _IDENTITY_CACHE_TTL_SECONDS:
+        return cached[0]
+
     try:
-        table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
+        table = _get_connections_table()
 
-        # Query using the GSI on identity_id
+        # Fast path: the $connect handler writes an inverted lookup item
+        # keyed by identity, so this is a GetItem on the primary key
+        response = table.get_item(
+            Key={'connection_id': f"IDENT#{identity_id}"},
+            ProjectionExpression='active_connection_id'
+        )
+        item = response.get('Item')
+        if item and 'active_connection_id' in item:
+            connection_id = item['active_connection_id']
+            _identity_connection_cache[identity_id] = (connection_id, time.time())
+            return connection_id
+
+        # Fall back to the GSI for connections recorded before the inverted
+        # item existed
         response = table.query(
             IndexName='identity-index',
             KeyConditionExpression='identity_id = :identity_id',
             ExpressionAttributeValues={
                 ':identity_id': identity_id
             },
+            ProjectionExpression='connection_id',
+            Select='SPECIFIC_ATTRIBUTES',
             Limit=1,  # We only need one active connection
             ScanIndexForward=False  # Get the most recent one
         )
 
         items = response.get('Items', [])
         if items:
-            return items[0]['connection_id']
+            connection_id = items[0]['connection_id']
+            _identity_connection_cache[identity_id] = (connection_id, time.time())
+            return connection_id
 
         return None
 
@@ -100,43 +217,74 @@ def send_websocket_message(
     Returns:
         True if successful, False otherwise
     """
-    try:
-        # Initialize API Gateway Management API client with the correct endpoint
-        client = boto3.client(
-            'apigatewaymanagementapi',
-            endpoint_url=WEBSOCKET_ENDPOINT,
-            region_name=AWS_REGION
-        )
+    if not WEBSOCKET_API_ID:
+        logger.debug("WEBSOCKET_API_ID not set; skipping WebSocket send")
+        return False
+
+    return _post_to_connection(connection_id, _encode_message(message_type, payload))
+
+
+def _encode_message(message_type: MessageType, payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a message envelope to the bytes sent over the socket.
 
-        # Construct the message
-        import time
-        message = {
-            'type': message_type,
-            'payload': payload,
-            'timestamp': int(time.time() * 1000)  # Milliseconds since epoch
-        }
+    Broadcast callers encode once and reuse the bytes for every recipient.
 
-        # Send the message
+    Args:
+        message_type: Type of UI update message
+        payload: Message payload
+    """
+    message = {
+        'type': message_type,
+        'payload': payload,
+        'timestamp': time.time_ns() // 1_000_000  # Milliseconds since epoch
+    }
+    # Tool inputs are already schema-validated upstream, so serialize with
+    # orjson (C-level encoder, emits bytes directly) when available instead
+    # of the stdlib str-then-encode path
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message).encode('utf-8')
+
+
+def _post_to_connection(connection_id: str, data: bytes) -> bool:
+    """
+    Post pre-encoded frame bytes to a WebSocket connection.
+
+    Args:
+        connection_id: WebSocket connection ID
+        data: The serialized message envelope
+
+    Returns:
+        True if successful, False otherwise
+    """
+    gone_at = _gone_connections.get(connection_id)
+    if gone_at is not None:
+        if time.time() - gone_at < _GONE_TTL_SECONDS:
+            return False
+        del _gone_connections[connection_id]
+
+    try:
+        client = _get_apigw_client()
         client.post_to_connection(
             ConnectionId=connection_id,
-            Data=json.dumps(message).encode('utf-8')
+            Data=data
         )
 
-        logger.info(f"Message sent to connection {connection_id}: {message_type}")
+        logger.debug(f"Message sent to connection {connection_id}")
         return True
 
     except client.exceptions.GoneException:
         logger.warning(f"Connection {connection_id} is gone (stale)")
-        # Optionally: Clean up stale connection from DynamoDB
-        try:
-            table = dynamodb.Table(CONNECTIONS_TABLE_NAME)
-            table.delete_item(Key={'connection_id': connection_id})
-        except Exception as cleanup_error:
-            logger.error(f"Error cleaning up stale connection: {str(cleanup_error)}")
+        _gone_connections[connection_id] = time.time()
+        _invalidate_connection(connection_id)
+        # The send already failed; don't block the caller on the DynamoDB
+        # round-trip to clean up the stale row
+        _broadcast_executor.submit(_delete_stale_connection, connection_id)
         return False
 
-    except Exception as error:
-        logger.error(f"Error sending WebSocket message: {str(error)}", exc_info=True)
+    except Exception:
+        logger.exception("Error sending WebSocket message")
         return False
 
 
@@ -156,6 +304,10 @@ def send_ui_update_to_identity(
     Returns:
         True if successful, False otherwise
     """
+    if not WEBSOCKET_API_ID:
+        logger.debug("WEBSOCKET_API_ID not set; skipping WebSocket send")
+        return False
+
     # Get the connection ID for this identity
     connection_id = get_connection_id_for_identity(identity_id)
 
@@ -165,3 +317,99 @@ def send_ui_update_to_identity(
 
     # Send the message
     return send_websocket_message(connection_id, message_type, payload)
+
+
+# Workers spawn on demand; each send is I/O-bound and boto3 releases the GIL
+# during the HTTP round-trip, so broadcasts overlap instead of serializing
+_broadcast_executor = ThreadPoolExecutor(max_workers=16)
+
+
+def send_ui_update_to_identities(
+    identity_ids: list,
+    message_type: MessageType,
+    payload: Dict[str, Any]
+) -> Dict[str, bool]:
+    """
+    Send the same UI update to several identities in parallel.
+
+    Args:
+        identity_ids: Cognito Identity IDs to broadcast to
+        message_type: Type of UI update
+        payload: Message payload (shared across all sends)
+
+    Returns:
+        Mapping of identity_id to send success
+    """
+    if not identity_ids:
+        return {}
+    if not WEBSOCKET_API_ID:
+        return {identity_id: False for identity_id in identity_ids}
+
+    connections = _batch_resolve_connection_ids(identity_ids)
+
+    # Encode once; every resolved recipient gets the same bytes
+    data = _encode_message(message_type, payload)
+
+    futures = {}
+    for identity_id in identity_ids:
+        connection_id = connections.get(identity_id)
+        if connection_id:
+            futures[identity_id] = _broadcast_executor.submit(_post_to_connection, connection_id, data)
+        else:
+            # Pre-inverted-item connections still resolve through the GSI path
+            futures[identity_id] = _broadcast_executor.submit(send_ui_update_to_identity, identity_id, message_type, payload)
+    return {identity_id: future.result() for identity_id, future in futures.items()}
+
+
+def _batch_resolve_connection_ids(identity_ids: list) -> Dict[str, str]:
+    """
+    Resolve many identities to connection IDs with as few DynamoDB calls as possible.
+
+    Cached mappings are used directly; the rest are fetched through the
+    inverted lookup items with BatchGetItem, 100 keys per request.
+
+    Args:
+        identity_ids: Cognito Identity IDs to resolve
+
+    Returns:
+        Mapping of identity_id to connection_id for every identity resolved
+    """
+    now = time.time()
+    connections: Dict[str, str] = {}
+    unresolved = []
+    for identity_id in identity_ids:
+        cached = _identity_connection_cache.get(identity_id)
+        if cached is not None and now - cached[1] < _IDENTITY_CACHE_TTL_SECONDS:
+            connections[identity_id] = cached[0]
+        else:
+            unresolved.append(identity_id)
+
+    for start in range(0, len(unresolved), 100):
+        chunk = unresolved[start:start + 100]
+        keys = [{'connection_id': f"IDENT#{identity_id}"} for identity_id in chunk]
+        for attempt in range(3):
+            try:
+                response = _dynamodb().batch_get_item(
+                    RequestItems={
+                        CONNECTIONS_TABLE_NAME: {
+                            'Keys': keys,
+                            'ProjectionExpression': 'connection_id, active_connection_id'
+                        }
+                    }
+                )
+            except Exception as error:
+                logger.error(f"Error batch-resolving connections: {str(error)}")
+                break
+            for item in response.get('Responses', {}).get(CONNECTIONS_TABLE_NAME, []):
+                identity_id = item['connection_id'].removeprefix('IDENT#')
+                connection_id = item.get('active_connection_id')
+                if connection_id:
+                    connections[identity_id] = connection_id
+                    _identity_connection_cache[identity_id] = (connection_id, now)
+            unprocessed = response.get('UnprocessedKeys', {})
+            if not unprocessed:
+                break
+            keys = unprocessed[CONNECTIONS_TABLE_NAME]['Keys']
+            time.sleep(0.05 * (attempt + 1))
+
+    return connections
@@ -12,20 +12,19 @@ import argparse
 import json
 import time
 import urllib.parse
-import string
-import random
+import secrets
+import queue
+import threading
 from typing import Optional
 from colorama import init, Fore, Style, Back
 from dotenv import load_dotenv
-import boto3
 import atexit
 
 
-def cleanup(refresh_token: str | None):
+def cleanup(idp_client, refresh_token: str | None):
     if(refresh_token):
         print("Revoking refresh token...")
         try:
-            idp_client = boto3.client('cognito-idp', region_name=os.getenv("AWS_REGION"))
             idp_client.revoke_token(
                 ClientId=os.getenv("COGNITO_CLIENT_ID"),
                 Token=refresh_token
@@ -41,9 +40,58 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.bedrock_agentcore_stream import BedrockAgentCoreStreamClient, EventType
 
+# The one EventType compared per event outside the dispatch table; bound here
+# so the verbose path skips the LOAD_GLOBAL + LOAD_ATTR pair per event
+_ET_ERROR = EventType.ERROR
+
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+# ANSI sequences bound once at import. Fore/Style attribute lookups are cheap
+# individually but add up when repeated for every streamed token.
+_C_BLUE = Fore.BLUE
+_C_CYAN = Fore.CYAN
+_C_GREEN = Fore.GREEN
+_C_YELLOW = Fore.YELLOW
+_C_RED = Fore.RED
+_C_WHITE = Fore.WHITE
+_C_MAGENTA = Fore.MAGENTA
+_BG_RED = Back.RED
+_RESET = Style.RESET_ALL
+
+# Separator rules used on every message boundary, built once
+_RULE_EQ = f"{_C_BLUE}{'=' * 60}{_RESET}"
+_RULE_DASH = f"\n{_C_CYAN}{'─' * 50}{_RESET}\n"
+
+# Inline tags scanned for while streaming content, plus every proper prefix
+# of each tag for O(1) membership checks when holding back a partial tag
+_TAG_OPEN = "<thinking>"
+_TAG_CLOSE = "</thinking>"
+_TAG_OPEN_PREFIXES = frozenset(_TAG_OPEN[:i] for i in range(1, len(_TAG_OPEN)))
+_TAG_CLOSE_PREFIXES = frozenset(_TAG_CLOSE[:i] for i in range(1, len(_TAG_CLOSE)))
+
+_THINK_HEADER = f"\n{_C_CYAN}🤔 Thinking...{_RESET}\n"
+
+
+def _partial_tag_len(data: str, pos: int, tag: str, prefixes: frozenset) -> int:
+    """Length of the longest suffix of data[pos:] that begins tag.
+
+    Both tags contain '<' only at position 0, so only a suffix starting at
+    the last '<' can be a tag prefix: one rfind plus one set lookup.
+
+    Args:
+        data: The text being scanned
+        pos: Start of the unprocessed region
+        tag: The tag a suffix could be starting
+        prefixes: Precomputed proper prefixes of that tag
+    """
+    start = data.rfind('<', max(pos, len(data) - len(tag) + 1))
+    if start == -1:
+        return 0
+    if data[start:] in prefixes:
+        return len(data) - start
+    return 0
+
 # Load environment variables
 load_dotenv()
 
@@ -51,15 +99,45 @@ load_dotenv()
 class CLIStreamDisplay:
     """Handles the display of streaming events in the CLI"""
 
+    # Flush streamed output at most once per ~16ms (one TTY frame); faster
+    # flushing just burns syscalls without looking any smoother
+    FLUSH_INTERVAL_SECONDS = 0.016
+
     def __init__(self, verbose: bool = False, show_thinking: bool = True):
         self.verbose = verbose
         self.show_thinking_enabled = show_thinking
         self.current_section = None
 
-        # Content accumulation for thinking detection
-        self.content_buffer = ""
-        self.display_position = 0  # Position up to which we've displayed content
+        # Streaming thinking detection: whether we're inside a <thinking>
+        # block, plus at most one partial tag held back between deltas
         self.in_thinking = False
+        self._pending = ""
+
+        # Tool-input accumulation; plain attributes so the delta path avoids
+        # hasattr (a try/except under the hood) on every event. Deltas are
+        # collected in a list and joined once at TOOL_USE_STOP — += on a
+        # string would recopy the whole input per delta
+        self.current_tool_id = None
+        self.current_tool_input_parts = []
+
+        # Buffered streaming output: deltas write here and flushes are
+        # rate-limited, with a guaranteed flush on block boundaries
+        self._out = sys.stdout
+        self._last_flush = time.monotonic()
+
+        # Event dispatch table; resolves each EventType attribute once here
+        # instead of once per comparison per event
+        self._handlers = {
+            EventType.MESSAGE_START: self._start_new_message,
+            EventType.MESSAGE_STOP: self._finalize_message,
+            EventType.CONTENT_BLOCK_START: self._on_content_block_start,
+            EventType.CONTENT_BLOCK_DELTA: self._on_content_block_delta,
+            EventType.CONTENT_BLOCK_STOP: self._on_content_block_stop,
+            EventType.TOOL_USE_START: self._on_tool_use_start,
+            EventType.TOOL_USE_DELTA: self._on_tool_use_delta,
+            EventType.TOOL_USE_STOP: self._on_tool_use_stop,
+            EventType.ERROR: self._display_error,
+        }
 
     def display_event(self, event):
         """Display a single stream event"""
@@ -68,271 +146,204 @@ class CLIStreamDisplay:
             # In verbose mode, show all events
             self._display_verbose_event(event)
         else:
-            # In normal mode, show formatted output
-            self._display_formatted_event(event)
+            # Formatted mode, dispatched inline: one dict probe both routes
+            # the event and drops types the formatted UI ignores
+            handler = self._handlers.get(event.type)
+            if handler is not None:
+                handler(event)
 
     def _display_verbose_event(self, event):
         """Display event in verbose/debug format"""
         timestamp = time.strftime('%H:%M:%S', time.localtime(event.timestamp))
 
         # Color code by event type
-        if event.type == EventType.ERROR:
-            color = Fore.RED
+        if event.type == _ET_ERROR:
+            color = _C_RED
         elif event.is_thinking:
-            color = Fore.CYAN
+            color = _C_CYAN
         elif event.is_tool_use:
-            color = Fore.YELLOW
+            color = _C_YELLOW
         elif event.is_content:
-            color = Fore.GREEN
+            color = _C_GREEN
         else:
-            color = Fore.WHITE
+            color = _C_WHITE
 
-        print(f"{Fore.BLUE}[{timestamp}]{Style.RESET_ALL} "
-              f"{color}{event.type.value}{Style.RESET_ALL}")
+        print(f"{_C_BLUE}[{timestamp}]{_RESET} "
+              f"{color}{event.type.value}{_RESET}")
 
         if event.data:
-            print(f"  {Fore.WHITE}{json.dumps(event.data, indent=2)}{Style.RESET_ALL}")
+            print(f"  {_C_WHITE}{json.dumps(event.data, indent=2)}{_RESET}")
         print()
 
-    def _display_formatted_event(self, event):
-        """Display event in user-friendly format"""
-        # Message lifecycle events
-        if event.type == EventType.MESSAGE_START:
-            self._start_new_message(event)
-        elif event.type == EventType.MESSAGE_STOP:
-            self._finalize_message(event)
-
-        # Content events
-        elif event.type == EventType.CONTENT_BLOCK_START:
+    def _on_content_block_start(self, event):
+        """Handle the start of a content block"""
+        self._start_section("content")
+        # Reset streaming state for new content block
+        self.in_thinking = False
+        self._pending = ""
+        content_type = event.data.get("type", "text")
+        if content_type == "text":
+            print(f"\n{_C_GREEN}💬 Response:{_RESET}\n")
+
+    def _on_content_block_delta(self, event):
+        """Handle a streamed content delta"""
+        # Auto-start content section if not already started
+        if self.current_section != "content":
             self._start_section("content")
-            # Reset buffers for new content block
-            self.content_buffer = ""
-            self.display_position = 0
+            # Reset streaming state for new content block
             self.in_thinking = False
-            content_type = event.data.get("type", "text")
-            if content_type == "text":
-                print(f"\n{Fore.GREEN}💬 Response:{Style.RESET_ALL}\n")
-        elif event.type == EventType.CONTENT_BLOCK_DELTA:
-            # Auto-start content section if not already started
-            if self.current_section != "content":
-                self._start_section("content")
-                # Reset buffers for new content block
-                self.content_buffer = ""
-                self.display_position = 0
-                self.in_thinking = False
-                print(f"\n{Fore.GREEN}💬 Response:{Style.RESET_ALL}\n")
-            text = event.get_text()
-            if text:
-                self._handle_content_with_thinking(text)
-        elif event.type == EventType.CONTENT_BLOCK_STOP:
-            print()  # New line after content block
-            self._end_section()
-
-        # Tool use events
-        elif event.type == EventType.TOOL_USE_START:
-            self._start_section("tool")
-            tool_name = event.data.get("name", "unknown")
-            tool_id = event.data.get("id", "unknown")
-            print(f"\n{Fore.YELLOW}🔧 Using tool: {tool_name}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}   Tool ID: {tool_id}{Style.RESET_ALL}")
-            # Store current tool for accumulating input
-            self.current_tool_id = tool_id
-            self.current_tool_input = ""
-        elif event.type == EventType.TOOL_USE_DELTA:
-            # Accumulate tool input using current_tool_id
-            delta_input = event.data.get("delta", {}).get("input", "")
-            if hasattr(self, 'current_tool_input'):
-                self.current_tool_input += delta_input
-        elif event.type == EventType.TOOL_USE_STOP:
-            # Display accumulated tool input if available
-            if hasattr(self, 'current_tool_input') and self.current_tool_input:
-                try:
-                    parsed_input = json.loads(self.current_tool_input)
-                    print(f"{Fore.YELLOW}   Input: {json.dumps(parsed_input, indent=2)}{Style.RESET_ALL}")
-                except json.JSONDecodeError:
-                    print(f"{Fore.YELLOW}   Input: {self.current_tool_input}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}   ✓ Tool completed{Style.RESET_ALL}")
-            # Clear current tool state
-            if hasattr(self, 'current_tool_id'):
-                delattr(self, 'current_tool_id')
-            if hasattr(self, 'current_tool_input'):
-                delattr(self, 'current_tool_input')
-            self._end_section()
-
-        # Error events
-        elif event.type == EventType.ERROR:
-            self._display_error(event)
-
-    def _is_partial_tag(self, buffer_end: str) -> bool:
-        """Check if buffer ends with a partial tag"""
-        potential_tags = ["<thinking>", "</thinking>"]
-        for tag in potential_tags:
-            for i in range(1, len(tag)):
-                if buffer_end.endswith(tag[:i]):
-                    return True
-        return False
+            self._pending = ""
+            print(f"\n{_C_GREEN}💬 Response:{_RESET}\n")
+        text = event.get_text()
+        if text:
+            self._handle_content_with_thinking(text)
+
+    def _on_content_block_stop(self, event):
+        """Handle the end of a content block"""
+        if self._pending:
+            # A held-back partial tag that never completed is plain text
+            if not self.in_thinking:
+                self._out.write(self._pending)
+            elif self.show_thinking_enabled:
+                self._out.write(f"{_C_CYAN}{self._pending}{_RESET}")
+            self._pending = ""
+        print()  # New line after content block
+        self._flush_now()
+        self._end_section()
+
+    def _on_tool_use_start(self, event):
+        """Handle the start of a tool invocation"""
+        self._start_section("tool")
+        tool_name = event.data.get("name", "unknown")
+        tool_id = event.data.get("id", "unknown")
+        print(f"\n{_C_YELLOW}🔧 Using tool: {tool_name}{_RESET}")
+        print(f"{_C_YELLOW}   Tool ID: {tool_id}{_RESET}")
+        # Store current tool for accumulating input
+        self.current_tool_id = tool_id
+        self.current_tool_input_parts = []
+
+    def _on_tool_use_delta(self, event):
+        """Accumulate streamed tool input"""
+        delta_input = event.data.get("delta", {}).get("input", "")
+        if self.current_tool_id is not None:
+            self.current_tool_input_parts.append(delta_input)
+
+    def _on_tool_use_stop(self, event):
+        """Display accumulated tool input and reset tool state"""
+        tool_input = ''.join(self.current_tool_input_parts)
+        if tool_input:
+            try:
+                parsed_input = json.loads(tool_input)
+                print(f"{_C_YELLOW}   Input: {json.dumps(parsed_input, indent=2)}{_RESET}")
+            except json.JSONDecodeError:
+                print(f"{_C_YELLOW}   Input: {tool_input}{_RESET}")
+        print(f"{_C_YELLOW}   ✓ Tool completed{_RESET}")
+        # Clear current tool state
+        self.current_tool_id = None
+        self.current_tool_input_parts = []
+        self._end_section()
 
     def _handle_content_with_thinking(self, text: str):
-        """Handle content delta, detecting and displaying thinking tags"""
+        """Handle content delta, detecting and displaying thinking tags.
+
+        Scans only the newly arrived text (plus a held-back partial tag of
+        bounded length), so each delta costs time proportional to the delta
+        rather than to everything streamed so far.
+        """
         if not text:
             return
 
-        # Add new text to buffer
-        self.content_buffer += text
-
-        # Find thinking tags in the entire buffer
-        thinking_start_idx = self.content_buffer.find("<thinking>")
-        thinking_end_idx = self.content_buffer.find("</thinking>")
-
-        # Determine how much we can safely display
-        if not self.in_thinking:
-            # Not in thinking mode
-            if thinking_start_idx != -1:
-                # Found opening tag - display everything before it
-                before_thinking = self.content_buffer[self.display_position:thinking_start_idx]
-                if before_thinking:
-                    print(f"{before_thinking}", end="", flush=True)
-
-                # Start thinking mode
+        show_thinking = self.show_thinking_enabled
+        data = self._pending + text if self._pending else text
+        self._pending = ""
+        pos = 0
+        end = len(data)
+        out = []
+
+        while pos < end:
+            if not self.in_thinking:
+                idx = data.find(_TAG_OPEN, pos)
+                if idx == -1:
+                    # Hold back a suffix that could start an opening tag
+                    safe_end = end - _partial_tag_len(data, pos, _TAG_OPEN, _TAG_OPEN_PREFIXES)
+                    if safe_end > pos:
+                        out.append(data[pos:safe_end])
+                    self._pending = data[safe_end:]
+                    break
+                if idx > pos:
+                    out.append(data[pos:idx])
                 self.in_thinking = True
-                if self.show_thinking_enabled:
-                    print(f"\n{Fore.CYAN}🤔 Thinking...{Style.RESET_ALL}\n", end="", flush=True)
-
-                self.display_position = thinking_start_idx + len("<thinking>")
-
-                # Check if we have the closing tag too
-                if thinking_end_idx != -1 and thinking_end_idx > thinking_start_idx:
-                    # Complete thinking block
-                    thinking_content = self.content_buffer[self.display_position:thinking_end_idx]
-                    if self.show_thinking_enabled and thinking_content:
-                        print(f"{Fore.CYAN}{thinking_content}{Style.RESET_ALL}", end="", flush=True)
-                    if self.show_thinking_enabled:
-                        print(f"\n{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}\n", end="", flush=True)
-
-                    self.in_thinking = False
-                    self.display_position = thinking_end_idx + len("</thinking>")
-
-                    # Recursively process remaining content
-                    remaining = self.content_buffer[self.display_position:]
-                    if remaining and not self._is_partial_tag(remaining):
-                        print(f"{remaining}", end="", flush=True)
-                        self.display_position = len(self.content_buffer)
-                else:
-                    # Only opening tag, show partial thinking content but check for partial closing tag
-                    content_after_open = self.content_buffer[self.display_position:]
-
-                    # Check if buffer ends with partial closing tag
-                    if self._is_partial_tag(content_after_open):
-                        # Hold back the partial tag
-                        safe_end = len(self.content_buffer)
-                        for i in range(1, len("</thinking>")):
-                            if self.content_buffer.endswith("</thinking>"[:i]):
-                                safe_end = len(self.content_buffer) - i
-                                break
-                        safe_content = self.content_buffer[self.display_position:safe_end]
-                        if self.show_thinking_enabled and safe_content:
-                            print(f"{Fore.CYAN}{safe_content}{Style.RESET_ALL}", end="", flush=True)
-                        self.display_position = safe_end
-                    else:
-                        # No partial tag, display all
-                        if self.show_thinking_enabled and content_after_open:
-                            print(f"{Fore.CYAN}{content_after_open}{Style.RESET_ALL}", end="", flush=True)
-                        self.display_position = len(self.content_buffer)
+                if show_thinking:
+                    out.append(_THINK_HEADER)
+                pos = idx + len(_TAG_OPEN)
             else:
-                # No opening tag found yet
-                # Check if buffer ends with partial opening tag
-                undisplayed = self.content_buffer[self.display_position:]
-
-                if self._is_partial_tag(undisplayed):
-                    # Hold back potential partial tag
-                    safe_end = len(self.content_buffer)
-                    for i in range(1, len("<thinking>")):
-                        if self.content_buffer.endswith("<thinking>"[:i]):
-                            safe_end = len(self.content_buffer) - i
-                            break
-                    safe_content = self.content_buffer[self.display_position:safe_end]
-                    if safe_content:
-                        print(f"{safe_content}", end="", flush=True)
-                    self.display_position = safe_end
-                else:
-                    # Safe to display everything
-                    if undisplayed:
-                        print(f"{undisplayed}", end="", flush=True)
-                    self.display_position = len(self.content_buffer)
-        else:
-            # In thinking mode - looking for closing tag
-            if thinking_end_idx != -1:
-                # Found closing tag
-                thinking_content = self.content_buffer[self.display_position:thinking_end_idx]
-                if self.show_thinking_enabled and thinking_content:
-                    print(f"{Fore.CYAN}{thinking_content}{Style.RESET_ALL}", end="", flush=True)
-                if self.show_thinking_enabled:
-                    print(f"\n{Fore.CYAN}{'─' * 50}{Style.RESET_ALL}\n", end="", flush=True)
-
+                idx = data.find(_TAG_CLOSE, pos)
+                if idx == -1:
+                    # Hold back a suffix that could start the closing tag
+                    safe_end = end - _partial_tag_len(data, pos, _TAG_CLOSE, _TAG_CLOSE_PREFIXES)
+                    if show_thinking and safe_end > pos:
+                        out += (_C_CYAN, data[pos:safe_end], _RESET)
+                    self._pending = data[safe_end:]
+                    break
+                if show_thinking:
+                    if idx > pos:
+                        out += (_C_CYAN, data[pos:idx], _RESET)
+                    out.append(_RULE_DASH)
                 self.in_thinking = False
-                self.display_position = thinking_end_idx + len("</thinking>")
-
-                # Process any remaining content
-                remaining = self.content_buffer[self.display_position:]
-                if remaining and not self._is_partial_tag(remaining):
-                    print(f"{remaining}", end="", flush=True)
-                    self.display_position = len(self.content_buffer)
-            else:
-                # Still in thinking, no closing tag yet
-                content_after_display = self.content_buffer[self.display_position:]
-
-                # Check for partial closing tag
-                if self._is_partial_tag(content_after_display):
-                    # Hold back the partial tag
-                    safe_end = len(self.content_buffer)
-                    for i in range(1, len("</thinking>")):
-                        if self.content_buffer.endswith("</thinking>"[:i]):
-                            safe_end = len(self.content_buffer) - i
-                            break
-                    safe_content = self.content_buffer[self.display_position:safe_end]
-                    if self.show_thinking_enabled and safe_content:
-                        print(f"{Fore.CYAN}{safe_content}{Style.RESET_ALL}", end="", flush=True)
-                    self.display_position = safe_end
-                else:
-                    # No partial tag, display all thinking content
-                    if self.show_thinking_enabled and content_after_display:
-                        print(f"{Fore.CYAN}{content_after_display}{Style.RESET_ALL}", end="", flush=True)
-                    self.display_position = len(self.content_buffer)
+                pos = idx + len(_TAG_CLOSE)
+
+        # One write per delta no matter how many segments it produced, then
+        # flush at most once per frame
+        if out:
+            self._out.write(''.join(out))
+            self._flush_if_due()
+
+    def _flush_if_due(self):
+        """Flush buffered output if a TTY frame has passed since the last flush."""
+        now = time.monotonic()
+        if now - self._last_flush > self.FLUSH_INTERVAL_SECONDS:
+            self._out.flush()
+            self._last_flush = now
+
+    def _flush_now(self):
+        """Flush buffered output unconditionally (block boundaries)."""
+        self._out.flush()
+        self._last_flush = time.monotonic()
 
     def _start_new_message(self, event):
         """Handle the start of a new message"""
         model = event.data.get("model", "unknown")
         role = event.data.get("role", "assistant")
-        print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}")
-        print(f"{Fore.BLUE}Model: {model} | Role: {role}{Style.RESET_ALL}")
-        print(f"{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}")
+        print(f"\n{_RULE_EQ}")
+        print(f"{_C_BLUE}Model: {model} | Role: {role}{_RESET}")
+        print(_RULE_EQ)
 
     def _finalize_message(self, event):
         """Handle the end of a message"""
-        print(f"\n{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}")
+        print(f"\n{_RULE_EQ}")
 
         # Display usage statistics if available
         usage = event.data.get("usage")
         if usage:
-            print(f"{Fore.MAGENTA}📊 Usage:{Style.RESET_ALL}")
+            print(f"{_C_MAGENTA}📊 Usage:{_RESET}")
             print(f"   Input tokens: {usage.get('inputTokens', 'N/A')}")
             print(f"   Output tokens: {usage.get('outputTokens', 'N/A')}")
             print(f"   Total tokens: {usage.get('totalTokens', 'N/A')}")
 
         stop_reason = event.data.get("stop_reason")
         if stop_reason:
-            print(f"{Fore.MAGENTA}Stop reason: {stop_reason}{Style.RESET_ALL}")
+            print(f"{_C_MAGENTA}Stop reason: {stop_reason}{_RESET}")
 
-        print(f"{Fore.BLUE}{'=' * 60}{Style.RESET_ALL}\n")
+        print(f"{_RULE_EQ}\n")
 
     def _display_error(self, event):
         """Display error event"""
-        print(f"\n{Back.RED}{Fore.WHITE} ERROR {Style.RESET_ALL}")
+        print(f"\n{_BG_RED}{_C_WHITE} ERROR {_RESET}")
         error_msg = event.data.get("error", "Unknown error")
         error_code = event.data.get("error_code", "")
-        print(f"{Fore.RED}❌ {error_msg}{Style.RESET_ALL}")
+        print(f"{_C_RED}❌ {error_msg}{_RESET}")
         if error_code:
-            print(f"{Fore.RED}   Error code: {error_code}{Style.RESET_ALL}")
+            print(f"{_C_RED}   Error code: {error_code}{_RESET}")
         print()
 
     def _start_section(self, section_type: str):
@@ -344,8 +355,50 @@ class CLIStreamDisplay:
         self.current_section = None
 
 
+# Sentinel marking the end of a stream on the render queue
+_STREAM_END = object()
+
+
+def display_stream(stream, display):
+    """
+    Render a stream of events, overlapping network receive with rendering.
+
+    A reader thread pulls events from the stream into a bounded queue while
+    the main thread renders them, so a slow terminal (scrollback, tmux)
+    doesn't backpressure the socket between deltas.
+
+    Args:
+        stream: Iterable of stream events
+        display: CLIStreamDisplay to render with
+    """
+    events = queue.Queue(maxsize=256)
+    failure = []
+
+    def _pull():
+        try:
+            for event in stream:
+                events.put(event)
+        except BaseException as error:
+            failure.append(error)
+        finally:
+            events.put(_STREAM_END)
+
+    reader = threading.Thread(target=_pull, daemon=True)
+    reader.start()
+    while (event := events.get()) is not _STREAM_END:
+        display.display_event(event)
+    reader.join()
+    if failure:
+        # Surface stream errors to the caller as if it had iterated directly
+        raise failure[0]
+
+
 def main():
     """Main CLI entry point"""
+    # One bound-method capture for the dozen env-var defaults below;
+    # os.getenv adds a wrapper call per lookup
+    env = os.environ.get
+
     parser = argparse.ArgumentParser(
         description="CLI demo for Bedrock AgentCore streaming responses"
     )
@@ -354,54 +407,54 @@ def main():
     parser.add_argument(
         "--agent-id",
         help="Agent ID to invoke",
-        default=os.getenv("BEDROCK_AGENT_ID")
+        default=env("BEDROCK_AGENT_ID")
     )
     parser.add_argument(
         "--api-key",
         help="API key to use",
-        default=os.getenv("AWS_BEARER_TOKEN_BEDROCK")
+        default=env("AWS_BEARER_TOKEN_BEDROCK")
     )
     parser.add_argument(
         "--client-id",
         help="Client ID to use",
-        default=os.getenv("COGNITO_CLIENT_ID")
+        default=env("COGNITO_CLIENT_ID")
     )
     parser.add_argument(
         "--username",
         help="Username to use",
-        default=os.getenv("COGNITO_USERNAME")
+        default=env("COGNITO_USERNAME")
     )
     parser.add_argument(
         "--password",
         help="Password to use",
-        default=os.getenv("COGNITO_PW")
+        default=env("COGNITO_PW")
     )
     parser.add_argument(
         "--auth-token",
         help="Auth token to use",
-        default=os.getenv("AGENTCORE_TOKEN")
+        default=env("AGENTCORE_TOKEN")
     )
     parser.add_argument(
         "--agent-arn",
         help="Agent ARN",
-        default=os.getenv("BEDROCK_AGENT_ARN")
+        default=env("BEDROCK_AGENT_ARN")
     )
     parser.add_argument(
         "--region",
         help="AWS region",
-        default=os.getenv("AWS_REGION", "us-east-1")
+        default=env("AWS_REGION", "us-east-1")
     )
     parser.add_argument(
         "--profile",
         help="AWS profile to use",
-        default=os.getenv("AWS_PROFILE")
+        default=env("AWS_PROFILE")
     )
 
     # Model invocation (for testing without agent)
     parser.add_argument(
         "--model-id",
         help="Model ID to use (for direct model invocation)",
-        default=os.getenv("BEDROCK_MODEL_ID", "us.amazon.nova-pro-v1:0")
+        default=env("BEDROCK_MODEL_ID", "us.amazon.nova-pro-v1:0")
     )
     parser.add_argument(
         "--use-model",
@@ -435,24 +488,33 @@ def main():
     )
     parser.add_argument(
         "--session-id",
-        help="Session ID for conversation continuity",
-        default=''.join(random.choice(string.ascii_letters + string.digits) for _ in range(36))
+        help="Session ID for conversation continuity (random if omitted)",
+        default=None
     )
 
     args = parser.parse_args()
+    # Generated lazily: an eager argparse default would pay for the random id
+    # even when the caller supplies one. token_urlsafe(27) gives 36 characters.
+    if not args.session_id:
+        args.session_id = secrets.token_urlsafe(27)
     # print(args)
 
     # Validate arguments
     if not args.use_model and not args.agent_id:
-        print(f"{Fore.RED}Error: Either --agent-id or --use-model must be specified{Style.RESET_ALL}")
+        print(f"{_C_RED}Error: Either --agent-id or --use-model must be specified{_RESET}")
         print("Set BEDROCK_AGENT_ID environment variable or use --agent-id flag")
         sys.exit(1)
 
-    escaped_agent_arn = urllib.parse.quote(args.agent_arn, safe='')
+    # ARNs are ASCII; quote_from_bytes skips quote()'s str handling and
+    # Quoter setup
+    escaped_agent_arn = urllib.parse.quote_from_bytes(args.agent_arn.encode('ascii'), safe=b'')
     url = f"https://bedrock-agentcore.{args.region}.amazonaws.com/runtimes/{escaped_agent_arn}/invocations?qualifier=DEFAULT&stream=true"
 
     # Initialize the client
     try:
+        # Deferred import: loading boto3 scans botocore's service models and
+        # dominates cold start, so --help and argument errors skip it
+        import boto3
         idp_client = boto3.client('cognito-idp', region_name=args.region)
         res = idp_client.initiate_auth(
             ClientId=args.client_id,
@@ -464,7 +526,9 @@ def main():
         )
         access_token = res['AuthenticationResult']['AccessToken']
         refresh_token = res['AuthenticationResult']['RefreshToken']
-        atexit.register(cleanup, refresh_token=refresh_token)
+        # Reuse the client built for initiate_auth; constructing a second one
+        # at exit would redo endpoint resolution and service-model parsing
+        atexit.register(cleanup, idp_client=idp_client, refresh_token=refresh_token)
         client = BedrockAgentCoreStreamClient(
             agent_id=args.agent_id or "dummy",  # Provide dummy ID if using model directly
             endpoint_url=url,
@@ -477,7 +541,7 @@ def main():
             show_thinking=not args.no_thinking
         )
 
-        print(f"{Fore.GREEN}✓ Connected to AWS Bedrock{Style.RESET_ALL}")
+        print(f"{_C_GREEN}✓ Connected to AWS Bedrock{_RESET}")
         if args.use_model:
             print(f"  Using model: {args.model_id}")
         else:
@@ -486,19 +550,19 @@ def main():
         print()
 
     except Exception as e:
-        print(f"{Fore.RED}Failed to initialize client: {e}{Style.RESET_ALL}")
+        print(f"{_C_RED}Failed to initialize client: {e}{_RESET}")
         sys.exit(1)
 
     # Process prompts
     if args.interactive:
-        print(f"{Fore.CYAN}Interactive mode - Type 'exit' to quit{Style.RESET_ALL}\n")
+        print(f"{_C_CYAN}Interactive mode - Type 'exit' to quit{_RESET}\n")
         session_id = args.session_id
 
         while True:
             try:
-                prompt = input(f"{Fore.GREEN}You: {Style.RESET_ALL}")
+                prompt = input(f"{_C_GREEN}You: {_RESET}")
                 if prompt.lower() in ['exit', 'quit', 'bye']:
-                    print(f"{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
+                    print(f"{_C_YELLOW}Goodbye!{_RESET}")
                     break
 
                 if not prompt.strip():
@@ -518,20 +582,19 @@ def main():
                         prompt=prompt,
                     )
                 # Display streaming response
-                for event in stream:
-                    display.display_event(event)
+                display_stream(stream, display)
 
             except KeyboardInterrupt:
-                print(f"\n{Fore.YELLOW}Interrupted{Style.RESET_ALL}")
+                print(f"\n{_C_YELLOW}Interrupted{_RESET}")
                 break
             except Exception as e:
-                print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+                print(f"{_C_RED}Error: {e}{_RESET}")
 
     else:
         # Single prompt mode
         prompt = args.prompt
         if not prompt:
-            prompt = input(f"{Fore.GREEN}Enter prompt: {Style.RESET_ALL}")
+            prompt = input(f"{_C_GREEN}Enter prompt: {_RESET}")
 
         try:
             if args.use_model:
@@ -549,11 +612,10 @@ def main():
                 )
 
             # Display streaming response
-            for event in stream:
-                display.display_event(event)
+            display_stream(stream, display)
 
         except Exception as e:
-            print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+            print(f"{_C_RED}Error: {e}{_RESET}")
             sys.exit(1)
 
 
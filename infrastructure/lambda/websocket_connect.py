@@ -58,6 +58,18 @@ def handler(event, context):
             }
         )
 
+        # Inverted lookup item keyed by identity so the backend can resolve
+        # identity -> connection with a GetItem instead of a GSI Query.
+        # identity_id is deliberately omitted so the GSI doesn't index this row.
+        table.put_item(
+            Item={
+                'connection_id': f"IDENT#{identity_id}",
+                'active_connection_id': connection_id,
+                'timestamp': Decimal(str(time.time())),
+                'ttl': ttl,
+            }
+        )
+
         print(f"Connection established: {connection_id} for identity: {identity_id}")
 
         return {
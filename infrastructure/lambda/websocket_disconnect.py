@@ -26,6 +26,10 @@ def handler(event, context):
     try:
         connection_id = event['requestContext']['connectionId']
 
+        # Read the row first so the inverted identity lookup item can be
+        # cleaned up as well
+        item = table.get_item(Key={'connection_id': connection_id}).get('Item')
+
         # Remove connection from DynamoDB
         table.delete_item(
             Key={
@@ -33,6 +37,18 @@ def handler(event, context):
             }
         )
 
+        if item and item.get('identity_id'):
+            try:
+                # Only delete the inverted item if it still points at this
+                # connection (the client may have already reconnected)
+                table.delete_item(
+                    Key={'connection_id': f"IDENT#{item['identity_id']}"},
+                    ConditionExpression='active_connection_id = :cid',
+                    ExpressionAttributeValues={':cid': connection_id}
+                )
+            except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+                pass
+
         print(f"Connection disconnected: {connection_id}")
 
         return {
@@ -15,6 +15,7 @@ import type {
   ProgressPayload,
   HighlightElementPayload,
   GraphPayload,
+  BatchUIUpdatePayload,
 } from '@/types/websocket-messages'
 
 interface UseWebSocketUIOptions {
@@ -175,6 +176,16 @@ export function useWebSocketUI({ enabled }: UseWebSocketUIOptions) {
           break
         }
 
+        case 'batch_ui_update': {
+          // Backend coalesces bursts of updates into one frame; unpack and
+          // route each one through the normal handlers
+          const payload = message.payload as BatchUIUpdatePayload
+          for (const update of payload.updates) {
+            handleWebSocketMessage({ ...message, type: update.type, payload: update.payload })
+          }
+          break
+        }
+
         default:
           console.warn('Unknown WebSocket message type:', message)
       }
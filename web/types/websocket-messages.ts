@@ -10,6 +10,7 @@ export type MessageType =
   | 'show_progress'
   | 'highlight_element'
   | 'show_graph'
+  | 'batch_ui_update'
 
 // Pricing information for competitor products
 export interface CompetitorPricing {
@@ -206,6 +207,14 @@ export interface GraphCarouselPayload {
   graphs: GraphPayload[]
 }
 
+// Several updates coalesced into one frame by the backend
+export interface BatchUIUpdatePayload {
+  updates: Array<{
+    type: MessageType
+    payload: WebSocketMessagePayload
+  }>
+}
+
 export type WebSocketMessagePayload =
   | CompetitorContextPayload
   | CompetitorCarouselPayload
@@ -216,6 +225,7 @@ export type WebSocketMessagePayload =
   | HighlightElementPayload
   | GraphPayload
   | GraphCarouselPayload
+  | BatchUIUpdatePayload
 
 export interface WebSocketMessage {
   type: MessageType